@@ -0,0 +1,155 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Per-user index of duels, ordered by their last activity.
+
+Every duel carries its last activity (`RT.LastActivity`, seconds since 1970) that
+create_duel, create_game and submit_guess set in the transaction of the change.
+The index of a user is built from the graph the first time it is needed in this
+process, and kept up to date by the same mutations through `touch`, so `User.duels`
+never has to walk a user's whole duel history to find the recent ones. Touches that
+arrive while an index is being built are applied to it before it is installed.
+At most ACTIVITY_INDEX_SIZE users keep an index, the least recently used are dropped.
+"""
+import os
+from bisect import bisect_left, insort
+from threading import Lock
+from time import time as unix_time
+
+from zef import *
+from zef.ops import *
+
+from lru import LRU
+
+ACTIVITY_INDEX_SIZE = int(os.getenv("ACTIVITY_INDEX_SIZE", "10000"))
+
+_lock = Lock()
+# user uid -> ([(-last_activity, duel uid)] sorted, {duel uid: last_activity})
+_indexes = LRU(ACTIVITY_INDEX_SIZE)
+# user uid -> the touches seen by each build of the user's index in progress
+_building = {}
+
+
+def activity_changes(duel, at: float = None) -> list:
+    """The changes that set the last activity of the duel, to add to its transaction."""
+    at = unix_time() if at is None else at
+    current = duel >> O[RT.LastActivity] | collect
+    if current is None:
+        return [(duel, RT.LastActivity, at)]
+    return [current <= at]
+
+
+def last_activity(duel) -> float:
+    """
+    The last activity of the duel, falling back on the instantiation of its last
+    game (or of the duel itself) for duels from before RT.LastActivity existed.
+    """
+    at = duel >> O[RT.LastActivity] | value_or[None] | collect
+    if at is not None:
+        return at
+    games = duel >> L[RT.Game] | collect
+    latest = games | last | collect if length(games) > 0 else duel
+    return time(latest | instantiated | collect).seconds_since_1970
+
+
+def _move(index, duel_id: str, at: float):
+    ordered, by_duel = index
+    previous = by_duel.get(duel_id)
+    if previous is not None:
+        i = bisect_left(ordered, (-previous, duel_id))
+        if i < len(ordered) and ordered[i] == (-previous, duel_id):
+            del ordered[i]
+    by_duel[duel_id] = at
+    insort(ordered, (-at, duel_id))
+
+
+def _index_for(user):
+    uid = str(user | origin_uid | collect)
+    with _lock:
+        index = _indexes.get(uid)
+        if index is not None:
+            return index
+        touches = []
+        _building.setdefault(uid, []).append(touches)
+    try:
+        by_duel = {str(d | origin_uid | collect): last_activity(d) for d in user << L[RT.Participant] | collect}
+        ordered = sorted((-at, duel_id) for duel_id, at in by_duel.items())
+    finally:
+        with _lock:
+            builds = _building[uid]
+            builds.remove(touches)
+            if not builds:
+                del _building[uid]
+    with _lock:
+        # Another request may have built it in the meantime, keep theirs.
+        index = _indexes.get(uid)
+        if index is not None:
+            return index
+        index = (ordered, by_duel)
+        # The graph read may have missed what was touched while it ran
+        for duel_id, at in touches:
+            if at >= by_duel.get(duel_id, at):
+                _move(index, duel_id, at)
+        return _indexes.put(uid, index)
+
+
+def touch(duel):
+    """
+    Moves the duel to its new place in the index of each participant that has one,
+    after a transaction that changed its last activity.
+    """
+    duel = now(duel)
+    at = last_activity(duel)
+    duel_id = str(duel | origin_uid | collect)
+    user_ids = [str(u | origin_uid | collect) for u in duel >> L[RT.Participant] | collect]
+    with _lock:
+        for uid in user_ids:
+            for touches in _building.get(uid, []):
+                touches.append((duel_id, at))
+            index = _indexes.get(uid)
+            if index is not None:
+                _move(index, duel_id, at)
+
+
+def recent_duel_ids(user, since: float = None, first: int = None, after: str = None) -> list:
+    """
+    The ids of the user's duels, most recently active first, that were active at or
+    after `since`, starting after the duel `after` and at most `first` of them.
+    """
+    ordered, by_duel = _index_for(user)
+    with _lock:
+        start = 0
+        if after is not None and after in by_duel:
+            start = bisect_left(ordered, (-by_duel[after], after)) + 1
+        end = len(ordered)
+        if since is not None:
+            end = bisect_left(ordered, (-since, chr(0x10ffff)), start)
+            end = max(end, start)
+        if first is not None:
+            end = min(end, start + max(first, 0))
+        return [duel_id for _, duel_id in ordered[start:end]]
+
+
+def parse_since(since) -> float:
+    """Accepts seconds since 1970 or an ISO 8601 date time, as sent by the clients."""
+    if since is None or isinstance(since, (int, float)):
+        return since
+    from datetime import datetime
+    return datetime.fromisoformat(since.replace("Z", "+00:00")).timestamp()
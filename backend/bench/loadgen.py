@@ -0,0 +1,164 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Replays duel traffic against the GraphQL API and reports the latency percentiles and
+throughput of each operation.
+
+Every simulated duel is two players going through what the app does: createUser,
+createDuel and createGame (with a solution from getRandomWord) for the creator,
+createUser and acceptDuel for the challenger, submitGuess until the game is solved
+or failed, then a new game created by the other player, and so on. Both players
+poll getDuel every 2.5 seconds meanwhile, as the Duel page does when it has no event
+stream. The documents sent are the ones in src (see operations.py).
+
+Run from the backend directory, either against a running server:
+
+    python -m bench.loadgen --url http://localhost:5010/gql --duels 20 --duration 60
+
+or let it start run_api.py from a snapshot (see snapshot.py) so runs are repeatable:
+
+    python -m bench.loadgen --snapshot worduel.snapshot --duels 20 --duration 60
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+from time import perf_counter, monotonic, sleep
+from urllib.request import Request, urlopen
+
+from bench import operations
+from bench.stats import Recorder
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+MAX_GUESSES = 6
+
+
+class Client:
+    def __init__(self, url: str, recorder: Recorder):
+        self.url = url
+        self.recorder = recorder
+        self.operations = operations.load()
+
+    def call(self, name: str, **variables):
+        body = json.dumps({"query": self.operations[name], "operationName": name, "variables": variables}).encode()
+        start = perf_counter()
+        error = False
+        try:
+            request = Request(self.url, data=body, headers={"Content-Type": "application/json"})
+            with urlopen(request) as response:
+                result = json.loads(response.read())
+            error = bool(result.get("errors"))
+            return result.get("data") or {}
+        except OSError:
+            error = True
+            return {}
+        finally:
+            self.recorder.add(name, perf_counter() - start, error)
+
+
+def poll(client: Client, duel_id: str, interval: float, stop: threading.Event, history_size: int):
+    while not stop.wait(interval):
+        client.call("getDuel", duelId=duel_id, historySize=history_size)
+
+
+def play_duel(client: Client, n: int, stop: threading.Event, poll_interval: float, think: float):
+    creator = client.call("createUser", name=f"bench-{n}-a").get("createUser")
+    challenger = client.call("createUser", name=f"bench-{n}-b").get("createUser")
+    duel_id = client.call("createDuel", creatorId=creator).get("createDuel")
+    if not (creator and challenger and duel_id):
+        return
+    solution = client.call("getRandomWord", length=5).get("getRandomWord")
+    game = client.call("createGame", solution=solution, duelId=duel_id, creatorId=creator).get("createGame") or {}
+    client.call("acceptDuel", duelId=duel_id, playerId=challenger)
+    client.call("myDuels", userId=challenger)
+
+    pollers = [threading.Thread(target=poll, args=(client, duel_id, poll_interval, stop, 20), daemon=True) for _ in range(2)]
+    for poller in pollers:
+        poller.start()
+
+    player = challenger
+    while not stop.is_set() and game.get("id"):
+        for _ in range(MAX_GUESSES):
+            if stop.wait(think):
+                return
+            guess = client.call("getRandomWord", length=5).get("getRandomWord")
+            result = client.call("submitGuess", gameId=game["id"], guess=guess).get("submitGuess") or {}
+            if result.get("solved") or result.get("failed"):
+                break
+        # The player of the last game creates the next one
+        solution = client.call("getRandomWord", length=5).get("getRandomWord")
+        game = client.call("createGame", solution=solution, duelId=duel_id, creatorId=player).get("createGame") or {}
+        player = creator if player == challenger else challenger
+
+
+def wait_for_port(port: int, timeout: float = 120):
+    deadline = monotonic() + timeout
+    while monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            sleep(0.5)
+    raise RuntimeError(f"Nothing listening on port {port} after {timeout}s")
+
+
+def start_server(snapshot: str, env: dict = None) -> subprocess.Popen:
+    env = {**os.environ, **(env or {}), "SNAPSHOT": os.path.abspath(snapshot), "SNAPSHOT_EPHEMERAL": "1"}
+    server = subprocess.Popen([sys.executable, "run_api.py"], cwd=BACKEND_DIR, env=env)
+    wait_for_port(5010)
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:5010/gql")
+    parser.add_argument("--snapshot", help="start run_api.py from this snapshot instead of using a running server")
+    parser.add_argument("--duels", type=int, default=10, help="number of duels played at the same time")
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument("--poll-interval", type=float, default=2.5, help="seconds between getDuel polls")
+    parser.add_argument("--think", type=float, default=1.0, help="seconds between guesses")
+    args = parser.parse_args()
+
+    server = start_server(args.snapshot) if args.snapshot else None
+    try:
+        recorder = Recorder()
+        client = Client(args.url, recorder)
+        stop = threading.Event()
+        duels = [threading.Thread(target=play_duel, args=(client, n, stop, args.poll_interval, args.think), daemon=True)
+                 for n in range(args.duels)]
+        start = monotonic()
+        for duel in duels:
+            duel.start()
+        sleep(args.duration)
+        stop.set()
+        for duel in duels:
+            duel.join(timeout=10)
+        print(recorder.report(monotonic() - start))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Micro-benchmarks of the hot paths of submitGuess and getDuel: guess eligibility,
+scoring a guess (computed and from the pattern table) and a duel's current score.
+
+Run from the backend directory on the graph of a snapshot (see snapshot.py):
+
+    python -m bench.micro --snapshot worduel.snapshot
+"""
+import argparse
+import random
+import timeit
+
+from zef import *
+from zef.ops import *
+
+
+def bench(name: str, fn, number: int):
+    best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"{name:<32}{best * 1e6:>10.2f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--snapshot", required=True)
+    parser.add_argument("--games", type=int, default=200, help="number of games of the duel scored by currentScore")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    import snapshot
+    import scoring
+    import pattern_table
+    import eligibility
+    from lexicon import lexicon_for
+    from scoreboard import current_score, rebuild, completion_changes, MAX_POINTS
+
+    g = snapshot.load(args.snapshot)
+    lexicon = lexicon_for(g, 5)
+    words = lexicon.ordered()
+    rng = random.Random(0)
+    pairs = [(rng.choice(words), rng.choice(words)) for _ in range(args.number)]
+    # Five previous guesses, and guesses of which a third aren't words
+    previous = {rng.choice(words) for _ in range(5)}
+    guesses = [guess if n % 3 else guess[::-1] + "Q" for n, (guess, _) in enumerate(pairs)]
+    it = iter(range(10**9))
+
+    def eligible():
+        return eligibility.check(guesses[next(it) % len(guesses)], 5, lexicon, previous)
+
+    def computed():
+        guess, solution = pairs[next(it) % len(pairs)]
+        return scoring.score(guess, solution)
+
+    def from_table():
+        guess, solution = pairs[next(it) % len(pairs)]
+        return pattern_table.score(lexicon, guess, solution)
+
+    bench("eligibility", eligible, args.number)
+    bench("score (computed)", computed, args.number)
+    if pattern_table.table_for(lexicon) is None:
+        print(f"{'score (pattern table)':<32}{'no table, run pattern_table.py':>10}")
+    else:
+        bench("score (pattern table)", from_table, args.number)
+
+    # A duel of two players with args.games completed games
+    users = [ET.User['a'], ET.User['b']]
+    r = [
+        (users[0], RT.Name, "bench-a"),
+        (users[1], RT.Name, "bench-b"),
+        (ET.Duel['d'], RT.Participant, Z['a']),
+        (Z['d'], RT.Participant, Z['b']),
+    ] | transact[g] | run
+    duel = r['d']
+    for n in range(args.games):
+        solution = rng.choice(words)
+        player = r['b' if n % 2 else 'a']
+        game = ([
+            (ET.Game['g'], RT.Solution, solution),
+            (Z['g'], RT.Creator, now(r['a' if n % 2 else 'b'])),
+            (Z['g'], RT.Player, now(player)),
+            (Z['g'], RT.Guess, solution),
+            (Z['g'], RT.Completed, False),
+            (now(duel), RT.Game, Z['g']),
+        ] | transact[g] | run)['g']
+        # Completed the way submit_guess does it, so the duel has a scoreboard like any other
+        [
+            (now(game) >> RT.Completed | collect) <= True,
+            *completion_changes(now(game), str(origin_uid(player)), MAX_POINTS - 1),
+        ] | transact[g] | run
+    bench(f"currentScore ({args.games} games)", lambda: current_score(now(duel)), 200)
+    bench(f"rebuild score ({args.games} games)", lambda: rebuild(now(duel)), 20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+The GraphQL operations of the frontend, read from the gql`` documents of its scenes
+and forms, so the benchmarks send exactly what the app sends.
+"""
+import os
+import re
+
+_src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src")
+SRC_DIRS = [os.path.join(_src, "scenes"), os.path.join(_src, "forms")]
+
+_document = re.compile(r"gql`(.*?)`", re.S)
+_operation = re.compile(r"\b(query|mutation)\s+(\w+)")
+
+
+def documents(src_dirs: list = [_src]) -> list:
+    """Every gql`` document under src_dirs, in file order."""
+    found = []
+    for root, _, files in (walked for src_dir in src_dirs for walked in os.walk(src_dir)):
+        for name in sorted(files):
+            if not name.endswith((".ts", ".tsx")):
+                continue
+            with open(os.path.join(root, name)) as f:
+                found.extend(document.strip() for document in _document.findall(f.read()))
+    return found
+
+
+def load(src_dirs: list = SRC_DIRS) -> dict:
+    """{operation name: document} of the gql`` documents under src_dirs."""
+    operations = {}
+    for document in documents(src_dirs):
+        match = _operation.search(document)
+        if match:
+            operations.setdefault(match.group(2), document)
+    return operations
@@ -0,0 +1,96 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Seeds a server with users and duels through the bulk mutations, for capacity tests
+on production-like volumes.
+
+    python -m bench.seed --url http://localhost:5010/gql --users 100000 --duels 100000
+
+Users are created with createUsers and duels with createDuels, --batch of them per
+request. Every duel gets a first game with a random solution, and --accepted of them
+(a fraction) are accepted by another random user.
+"""
+import argparse
+import json
+import random
+from time import monotonic
+from urllib.request import Request, urlopen
+
+CREATE_USERS = "mutation createUsers($names: [String]) { createUsers(names: $names) { success message ids } }"
+CREATE_DUELS = """mutation createDuels($creatorIds: [ID], $playerIds: [ID], $solutions: [String]) {
+  createDuels(creatorIds: $creatorIds, playerIds: $playerIds, solutions: $solutions) { success message ids }
+}"""
+GET_RANDOM_WORD = "query getRandomWord($length: Int) { getRandomWord(length: $length) }"
+# Solutions are drawn from this many random words
+WORD_POOL = 200
+
+
+def call(url: str, query: str, **variables):
+    body = json.dumps({"query": query, "variables": variables}).encode()
+    with urlopen(Request(url, data=body, headers={"Content-Type": "application/json"})) as response:
+        result = json.loads(response.read())
+    if result.get("errors"):
+        raise RuntimeError(result["errors"])
+    return result["data"]
+
+
+def created(result: dict) -> list:
+    """The ids of a createUsers/createDuels result, which reports failures in `message`."""
+    if not result or not result["success"]:
+        raise RuntimeError(result["message"] if result else "no result")
+    return result["ids"]
+
+
+def batches(n: int, size: int):
+    for start in range(0, n, size):
+        yield range(start, min(n, start + size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:5010/gql")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--duels", type=int, default=1000)
+    parser.add_argument("--accepted", type=float, default=0.8, help="fraction of the duels accepted by a second player")
+    parser.add_argument("--batch", type=int, default=1000, help="users or duels per request")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    start = monotonic()
+    users = []
+    for batch in batches(args.users, args.batch):
+        users += created(call(args.url, CREATE_USERS, names=[f"seed-{i}" for i in batch])["createUsers"])
+    print(f"{len(users)} users in {monotonic() - start:.1f}s")
+
+    start = monotonic()
+    words = [call(args.url, GET_RANDOM_WORD, length=5)["getRandomWord"] for _ in range(WORD_POOL)]
+    duels = 0
+    for batch in batches(args.duels if len(users) >= 2 else 0, args.batch):
+        pairs = [rng.sample(users, 2) for _ in batch]
+        duels += len(created(call(args.url, CREATE_DUELS,
+                          creatorIds=[creator for creator, _ in pairs],
+                          playerIds=[player if rng.random() < args.accepted else None for _, player in pairs],
+                          solutions=[rng.choice(words) for _ in batch])["createDuels"]))
+    print(f"{duels} duels in {monotonic() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
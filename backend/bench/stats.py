@@ -0,0 +1,54 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Latency samples per operation and their percentiles."""
+import threading
+
+
+def percentile(sorted_samples: list, p: float) -> float:
+    if not sorted_samples:
+        return float("nan")
+    k = min(len(sorted_samples) - 1, max(0, round(p / 100 * (len(sorted_samples) - 1))))
+    return sorted_samples[k]
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = {}
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float, error: bool = False):
+        with self._lock:
+            self.samples.setdefault(name, []).append(seconds)
+            if error:
+                self.errors[name] = self.errors.get(name, 0) + 1
+
+    def report(self, duration: float) -> str:
+        lines = [f"{'operation':<16}{'count':>8}{'errors':>8}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+        with self._lock:
+            items = sorted(self.samples.items())
+            errors = dict(self.errors)
+        for name, samples in items:
+            samples = sorted(samples)
+            lines.append(
+                f"{name:<16}{len(samples):>8}{errors.get(name, 0):>8}{len(samples) / duration:>9.1f}"
+                f"{percentile(samples, 50) * 1000:>9.1f}{percentile(samples, 95) * 1000:>9.1f}{percentile(samples, 99) * 1000:>9.1f}"
+            )
+        return "\n".join(lines)
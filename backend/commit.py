@@ -0,0 +1,134 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Committing the transactions of the mutations, optionally grouped.
+
+Every mutation commits a tiny transaction (a guess, a flipped `completed`, ...), so
+at peak the overhead of a transaction, not the resolvers, limits how many writes
+get through. With GROUP_COMMIT_MS set (0, the default, commits every transaction on
+its own), the changes of the mutations arriving within that many milliseconds are
+merged into a single transaction, and each caller gets the receipt of that
+transaction back.
+
+Callers that create entities name them with `unique_name`, so their names can't
+clash with another caller's in the merged transaction, and pass `keys` (the ids of
+what they change): two submissions sharing a key never go into the same group. If a
+merged transaction fails, its submissions are committed one by one so only the
+ones that fail on their own get an error.
+"""
+import itertools
+import os
+import threading
+from time import sleep
+
+from zef import *
+from zef.ops import *
+
+GROUP_COMMIT_MS = float(os.getenv("GROUP_COMMIT_MS", "0"))
+# Upper bound on the submissions merged into one transaction
+MAX_GROUP_SIZE = 256
+# Upper bound on the entities a bulk mutation (createUsers, createDuels) creates in one transaction
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "1000"))
+
+_names = itertools.count()
+
+
+def unique_name(name: str) -> str:
+    """A name for a new entity of the transaction that no other transaction of this process uses."""
+    return f"{name}_{next(_names)}"
+
+
+class _Submission:
+    def __init__(self, changes: list, keys):
+        self.changes = changes
+        self.keys = set(keys)
+        self.done = threading.Event()
+        self.receipt = None
+        self.error = None
+
+
+class _GroupCommitter:
+    def __init__(self, g, window_ms: float):
+        self.g = g
+        self.window = window_ms / 1000
+        self.pending = []
+        self.cond = threading.Condition()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, changes: list, keys):
+        submission = _Submission(changes, keys)
+        with self.cond:
+            self.pending.append(submission)
+            self.cond.notify()
+        submission.done.wait()
+        if submission.error is not None:
+            raise submission.error
+        return submission.receipt
+
+    def _next_group(self) -> list:
+        with self.cond:
+            while not self.pending:
+                self.cond.wait()
+        # Gives the mutations arriving right after the first one a chance to join it
+        sleep(self.window)
+        with self.cond:
+            group, keys, rest = [], set(), []
+            for submission in self.pending:
+                if len(group) < MAX_GROUP_SIZE and not (submission.keys & keys):
+                    group.append(submission)
+                    keys |= submission.keys
+                else:
+                    rest.append(submission)
+            self.pending = rest
+        return group
+
+    def _run(self):
+        while True:
+            group = self._next_group()
+            try:
+                receipt = [change for s in group for change in s.changes] | transact[self.g] | run
+                for s in group:
+                    s.receipt = receipt
+            except Exception:
+                for s in group:
+                    try:
+                        s.receipt = s.changes | transact[self.g] | run
+                    except Exception as exc:
+                        s.error = exc
+            for s in group:
+                s.done.set()
+
+
+_committers = {}
+_committers_lock = threading.Lock()
+
+
+def commit(g, changes: list, keys=()):
+    """
+    Commits the changes to g, on their own or grouped with other mutations' changes,
+    and returns the receipt of the transaction.
+    """
+    if GROUP_COMMIT_MS <= 0:
+        return changes | transact[g] | run
+    with _committers_lock:
+        committer = _committers.get(id(g))
+        if committer is None:
+            committer = _committers[id(g)] = _GroupCommitter(g, GROUP_COMMIT_MS)
+    return committer.submit(changes, keys)
@@ -0,0 +1,57 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Eligibility of a guess.
+
+check() goes through the three rules of submitGuess in one pass, cheapest first: the
+length of the guess, its membership in the lexicon's frozenset, then whether it is
+in the set of the game's previous guesses, which submit_guess keeps in the game's
+GameState (see game_state.py). No ZefOps are built or run to reject a guess.
+"""
+from enum import IntEnum
+
+
+class Reason(IntEnum):
+    ELIGIBLE = 0
+    WRONG_LENGTH = 1
+    NOT_IN_WORDLIST = 2
+    REPEATED = 3
+
+
+def message(reason: Reason, solution_length: int) -> str:
+    """The message submitGuess returns for a guess that isn't eligible."""
+    if reason == Reason.WRONG_LENGTH:
+        return f"Guess isn't {solution_length} characters long."
+    if reason == Reason.NOT_IN_WORDLIST:
+        return "Guess isn't in the wordlist."
+    if reason == Reason.REPEATED:
+        return "You made this guess before!"
+    return ""
+
+
+def check(guess: str, solution_length: int, lexicon, previous: set) -> Reason:
+    """Why the guess isn't eligible, Reason.ELIGIBLE if it is."""
+    if len(guess) != solution_length:
+        return Reason.WRONG_LENGTH
+    if guess not in lexicon.words:
+        return Reason.NOT_IN_WORDLIST
+    if guess in previous:
+        return Reason.REPEATED
+    return Reason.ELIGIBLE
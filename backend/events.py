@@ -0,0 +1,120 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Pushes duel changes to the clients watching them.
+
+The mutations call duel_changed once their transaction went through, and every
+client subscribed to that duel gets a server-sent event telling it what changed, so
+it can fetch the duel again right away instead of polling for it.
+
+The events are served by a small http server of their own, started next to the
+GraphQL server by run_api.py:
+
+    GET /events?duelId=<id>    text/event-stream, one `data: {"duelId", "type", "version"}` per change
+    GET /events?duelId=*       the same for every duel, only to local clients (the replica
+                               workers, see workers.py)
+"""
+import json
+import os
+import queue
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+EVENTS_PORT = int(os.getenv("EVENTS_PORT", "5011"))
+# Idle connections get a comment line every so often so proxies don't close them
+HEARTBEAT_SECONDS = 15
+# Subscribing to this gets the changes of every duel
+ALL_DUELS = "*"
+LOCAL_ADDRESSES = {"127.0.0.1", "::1"}
+
+_subscribers = {}
+_lock = threading.Lock()
+
+
+def subscribe(duel_id: str) -> queue.SimpleQueue:
+    q = queue.SimpleQueue()
+    with _lock:
+        _subscribers.setdefault(duel_id, set()).add(q)
+    return q
+
+
+def unsubscribe(duel_id: str, q: queue.SimpleQueue):
+    with _lock:
+        subscribers = _subscribers.get(duel_id, set())
+        subscribers.discard(q)
+        if not subscribers:
+            _subscribers.pop(duel_id, None)
+
+
+def duel_changed(duel_id: str, change: str, version: str = None):
+    """
+    Tells the clients watching a duel that it changed. change is one of "create",
+    "game", "guess" or "accept", version the duel's version after the change.
+    """
+    event = {"duelId": duel_id, "type": change, "version": version}
+    with _lock:
+        subscribers = list(_subscribers.get(duel_id, ())) + list(_subscribers.get(ALL_DUELS, ()))
+    for q in subscribers:
+        q.put(event)
+
+
+class EventsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        duel_id = parse_qs(url.query).get("duelId", [None])[0]
+        if url.path != "/events" or not duel_id:
+            self.send_error(404)
+            return
+        if duel_id == ALL_DUELS and self.client_address[0] not in LOCAL_ADDRESSES:
+            self.send_error(403)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        q = subscribe(duel_id)
+        try:
+            self.wfile.write(b": connected\n\n")
+            self.wfile.flush()
+            while True:
+                try:
+                    event = q.get(timeout=HEARTBEAT_SECONDS)
+                    self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+                except queue.Empty:
+                    self.wfile.write(b": heartbeat\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            unsubscribe(duel_id, q)
+
+    def log_message(self, *args, **kwds):
+        pass
+
+
+def start_server(port: int = EVENTS_PORT, bind_address: str = "0.0.0.0") -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((bind_address, port), EventsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
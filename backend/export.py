@@ -0,0 +1,160 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Export of the completed games for analytics.
+
+    python export.py [--format ndjson|arrow] [--out FILE] [--checkpoint FILE]
+
+streams every completed game out of the graph (by TAG, in its own process, so
+nothing goes through the GraphQL server) as one record per game: its id, duel,
+solution, guesses in order, completed, whether it was solved, creator and player
+ids and completion time. The records go out as newline-delimited JSON or, with
+pyarrow installed, as an Arrow IPC stream of record batches of BATCH_SIZE games.
+The games are read, converted and written one at a time by a chain of generators,
+so memory doesn't grow with the graph.
+
+submit_guess records when a game completes under RT.CompletedAt. An export only
+takes the games completed up to a few seconds before it started (SETTLE_SECONDS,
+so transactions still committing aren't skipped) and saves that time in the
+checkpoint file, the next export continues from there. Games completed before
+RT.CompletedAt existed only go into the first export.
+"""
+import argparse
+import json
+import os
+import sys
+from time import time as unix_time
+
+from zef import *
+from zef.ops import *
+
+CHECKPOINT_PATH = "export.checkpoint.json"
+SETTLE_SECONDS = 5
+BATCH_SIZE = 10000
+
+
+def read_checkpoint(path: str):
+    """The completion time the last export went up to, None if there wasn't one."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)["completedUntil"]
+
+
+def write_checkpoint(path: str, until: float):
+    with open(path + ".tmp", "w") as f:
+        json.dump({"completedUntil": until}, f)
+    os.replace(path + ".tmp", path)
+
+
+def completed_games(g, since, until: float):
+    """The games completed after `since` (None for all of them) and up to `until`."""
+    for game in g | now | all[ET.Game]:
+        if not (game >> O[RT.Completed] | value_or[False] | collect):
+            continue
+        at = game >> O[RT.CompletedAt] | value_or[None] | collect
+        if at is None:
+            if since is None:
+                yield game, None
+        elif (since is None or at > since) and at <= until:
+            yield game, at
+
+
+def _uid(z):
+    return None if z is None else str(origin_uid(z))
+
+
+def records(games):
+    for game, at in games:
+        solution = game >> RT.Solution | value | collect
+        guesses = game >> L[RT.Guess] | value | collect
+        yield {
+            "id": _uid(game),
+            "duelId": _uid(game << O[RT.Game] | collect),
+            "solution": solution,
+            "guesses": guesses,
+            "completed": True,
+            "solved": bool(guesses) and to_upper_case(guesses[-1]) == solution,
+            "creatorId": _uid(game >> O[RT.Creator] | collect),
+            "playerId": _uid(game >> O[RT.Player] | collect),
+            "completedAt": at,
+        }
+
+
+def write_ndjson(records, out) -> int:
+    n = 0
+    for record in records:
+        out.write(json.dumps(record) + "\n")
+        n += 1
+    return n
+
+
+def write_arrow(records, out) -> int:
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise SystemExit("The arrow format needs pyarrow: pip install pyarrow")
+    schema = pa.schema([
+        ("id", pa.string()), ("duelId", pa.string()), ("solution", pa.string()),
+        ("guesses", pa.list_(pa.string())), ("completed", pa.bool_()), ("solved", pa.bool_()),
+        ("creatorId", pa.string()), ("playerId", pa.string()), ("completedAt", pa.float64()),
+    ])
+    n = 0
+    with pa.ipc.new_stream(out, schema) as writer:
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) == BATCH_SIZE:
+                writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+                n += len(batch)
+                batch = []
+        if batch:
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            n += len(batch)
+    return n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--format", choices=["ndjson", "arrow"], default="ndjson")
+    parser.add_argument("--out", help="file to write to, stdout by default")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH, help="where the export resumes from and is saved to")
+    parser.add_argument("--full", action="store_true", help="export every completed game, ignoring the checkpoint")
+    args = parser.parse_args()
+
+    since = None if args.full else read_checkpoint(args.checkpoint)
+    until = unix_time() - SETTLE_SECONDS
+    g = Graph(os.getenv("TAG", "worduel/main3"))
+
+    write = write_arrow if args.format == "arrow" else write_ndjson
+    binary = args.format == "arrow"
+    if args.out:
+        with open(args.out, "wb" if binary else "w") as out:
+            n = write(records(completed_games(g, since, until)), out)
+    else:
+        n = write(records(completed_games(g, since, until)), sys.stdout.buffer if binary else sys.stdout)
+        sys.stdout.flush()
+
+    write_checkpoint(args.checkpoint, until)
+    print(f"Exported {n} games completed until {until}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Cache of completed games.
+
+Once a game is completed, nothing about it changes anymore: its solution, guesses,
+player and creator are final. The first time a completed game is resolved (or when
+submit_guess completes it) everything the Game type serves of it is put in a dict,
+kept in an LRU of GAME_CACHE_SIZE games (10000 by default), and the Duel fields
+return that dict instead of the game itself. The Game field resolvers answer from
+the dict without touching the graph, so a duel's history costs a lookup per game.
+
+The dict keeps the ids of the player, creator and duel; those are resolved again
+on every request since users and duels do change. The traceID is drawn once, so a
+completed game keeps the same one across requests.
+"""
+import os
+import random
+
+from zef import *
+from zef.ops import *
+
+from lru import LRU
+
+GAME_CACHE_SIZE = int(os.getenv("GAME_CACHE_SIZE", "10000"))
+
+_games = LRU(GAME_CACHE_SIZE)
+
+
+def trace_id(solution: str) -> str:
+    """
+    Encodes a game's solution in a pseudorandom string that the frontend can decode,
+    so the solution isn't sent in plain text.
+    """
+    return "".join(str(ord(c) + i) + str(random.randint(11, 99)) for i, c in enumerate(solution.upper()))
+
+
+def _snapshot(game, key: str) -> dict:
+    from versions import version_of
+    player = game >> O[RT.Player] | collect
+    creator = game >> O[RT.Creator] | collect
+    duel = game << O[RT.Game] | collect
+    solution = game >> RT.Solution | value | collect
+    return {
+        "id": key,
+        "completed": True,
+        "solution": solution,
+        "traceID": trace_id(solution),
+        "guesses": game >> L[RT.Guess] | value | collect,
+        "playerId": None if player is None else str(origin_uid(player)),
+        "creatorId": None if creator is None else str(origin_uid(creator)),
+        "duelId": None if duel is None else str(origin_uid(duel)),
+        "version": version_of(game),
+    }
+
+
+def fill(game) -> dict:
+    """Caches the game that was just completed."""
+    game = now(game)
+    return _games.put(str(origin_uid(game)), _snapshot(game, str(origin_uid(game))))
+
+
+def completed_game(game, context=None):
+    """The cached dict of the game if it is completed, None if it is still being played."""
+    key = str(origin_uid(game))
+    entry = _games.get(key)
+    if entry is not None:
+        return entry
+    completed = context.value(game, RT.Completed) if context is not None else (game >> O[RT.Completed] | value_or[False] | collect)
+    if not completed:
+        return None
+    return _games.put(key, _snapshot(game, key))
+
+
+def served(games: list, context=None) -> list:
+    """The games as the Duel fields return them: completed ones from the cache."""
+    return [completed_game(game, context) or game for game in games]
@@ -0,0 +1,103 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Cache of the state of the games being played.
+
+submitGuess needs a game's solution, guesses and completed flag before it can do
+anything, and those only change through submitGuess itself. The first time a game
+is guessed on, its state is read from the graph into a GameState; after that
+submit_guess updates the GameState in the same code path that commits each guess,
+so the next guess is validated and scored without reading the game again. Besides
+what is on the graph, a GameState keeps what the player knows of each letter so far
+(the best of ABSENT, PRESENT and EXACT it scored), learnt from the guessResult that
+submit_guess computes anyway rather than by scoring the guess again.
+
+States are filled and changed under the duel's lock (see locks.py), so they can't
+miss a guess of another request. A state is dropped when its game completes, when
+it hasn't been used for GAME_STATE_IDLE_SECONDS (30 minutes by default), or when
+there are more than GAME_STATE_SIZE of them (10000). Only the primary commits
+guesses: replicas forward submitGuess to it and never use this cache.
+"""
+import os
+from time import monotonic
+
+from zef import *
+from zef.ops import *
+
+from lru import LRU
+
+GAME_STATE_SIZE = int(os.getenv("GAME_STATE_SIZE", "10000"))
+GAME_STATE_IDLE_SECONDS = float(os.getenv("GAME_STATE_IDLE_SECONDS", "1800"))
+
+
+class GameState:
+    def __init__(self, duel_id: str, solution: str, guesses: list, completed: bool):
+        from scoring import digits
+        self.duel_id = duel_id
+        self.solution = solution
+        self.guesses = list(guesses)
+        self.previous = set(guesses)
+        self.completed = completed
+        self.letters = {}
+        for guess in guesses:
+            self._learn(guess, digits(guess, solution))
+        self.used = monotonic()
+
+    def _learn(self, guess: str, ds: list):
+        for c, d in zip(guess, ds):
+            self.letters[c] = max(self.letters.get(c, d), d)
+
+    def add_guess(self, guess: str, guess_result: list):
+        """Adds a guess that was just committed, with the guessResult it was scored."""
+        from scoring import ABSENT, PRESENT, EXACT
+        self.guesses.append(guess)
+        self.previous.add(guess)
+        self._learn(guess, [ABSENT if r == "_" else EXACT if r == c else PRESENT for c, r in zip(guess, guess_result)])
+
+
+_states = LRU(GAME_STATE_SIZE, expired=lambda state: state.used < monotonic() - GAME_STATE_IDLE_SECONDS)
+
+
+def duel_id_of(g, game_id: str) -> str:
+    """The id of the game's duel, from its state when there is one."""
+    state = _states.get(game_id)
+    if state is not None:
+        return state.duel_id
+    return str(now(g)[game_id] << RT.Game | origin_uid | collect)
+
+
+def state_for(g, game_id: str) -> GameState:
+    """The state of the game, read from the graph if it isn't cached. Call it under the duel's lock."""
+    state = _states.get(game_id)
+    if state is not None:
+        state.used = monotonic()
+        return state
+    game = now(g)[game_id]
+    state = GameState(
+        str(game << RT.Game | origin_uid | collect),
+        game >> RT.Solution | value | collect,
+        game >> L[RT.Guess] | value | collect,
+        game >> O[RT.Completed] | value_or[False] | collect,
+    )
+    return _states.put(game_id, state)
+
+
+def forget(game_id: str):
+    _states.pop(game_id)
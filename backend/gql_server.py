@@ -0,0 +1,133 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+The GraphQL HTTP server of worduel.
+
+Does what FX.GraphQL.StartServer does (the same HTTP effect and middleware), but
+executes the queries itself so that they go through the depth and cost limits of
+query_limits.py before any resolver runs, and are resolved with a RequestContext
+(request_context.py) of their own. The resolvers' metrics (metrics.py) are served
+on /metrics next to the GraphQL path. Only POST requests are answered on the GraphQL
+path, there is no playground page.
+
+Persisted queries are resolved first (persisted_queries.py), and documents are only
+parsed and validated against the schema the first time they're seen (query_plans.py).
+"""
+import json
+from time import perf_counter
+
+from zef import *
+from zef.ops import *
+from zef.core.fx.http import permit_cors, fallback_not_found, send_response, middleware_worker
+from graphql import MiddlewareManager, validate, execute as execute_document
+
+from query_limits import query_limits_rules
+from query_plans import PlanCache
+import persisted_queries
+from request_context import RequestContext, TRAVERSAL_STATS
+import metrics
+
+
+_plan_caches = {}
+
+
+def plan_for(schema, query: str, query_hash: str = None):
+    """The cached plan (query_plans.py) of a document for this schema."""
+    plans = _plan_caches.get(id(schema))
+    if plans is None:
+        plans = _plan_caches[id(schema)] = PlanCache(schema)
+    return plans.plan_for(query, query_hash)
+
+
+def _run(schema, data, context) -> dict:
+    if not isinstance(data, dict):
+        return {"errors": [{"message": "The request should be a JSON object."}]}
+    query, query_hash, error = persisted_queries.resolve(data)
+    if error is not None:
+        return {"errors": [error]}
+    if not isinstance(query, str):
+        return {"errors": [{"message": "The query should be a string."}]}
+    variables = data.get("variables") or {}
+    if not isinstance(variables, dict):
+        return {"errors": [{"message": "The variables should be a JSON object."}]}
+
+    plan = plan_for(schema, query, query_hash)
+    # The limits depend on the variables, so they're checked on every request
+    errors = plan.errors or (validate(schema, plan.document, query_limits_rules(variables)) if plan.document else [])
+    if errors:
+        return {"errors": [error.formatted for error in errors]}
+
+    result = execute_document(
+        schema, plan.document,
+        context_value=context,
+        variable_values=variables,
+        operation_name=data.get("operationName"),
+        middleware=MiddlewareManager(metrics.resolver_middleware) if metrics.METRICS else None,
+    )
+    return result.formatted
+
+
+def execute(schema, data) -> dict:
+    """Runs one GraphQL request (the decoded JSON body) and returns the result to send back."""
+    context = RequestContext()
+    start = perf_counter()
+    result = _run(schema, data, context)
+    if metrics.METRICS:
+        operation = data.get("operationName") if isinstance(data, dict) else None
+        metrics.record(metrics.OPERATIONS, metrics.operation_label(operation), perf_counter() - start, context.traversals)
+    if TRAVERSAL_STATS:
+        result.setdefault("extensions", {}).update(context.stats())
+    return result
+
+
+def start_server(g, port: int = 5010, bind_address: str = "0.0.0.0", path: str = "/gql", metrics_path: str = "/metrics"):
+    from zef.gql.generate_gql_api import make_api
+    schema = make_api(gql_schema(g))
+
+    def resolve_gql_query(req):
+        import copy
+        req = copy.deepcopy(req)
+        if req["path"] == path and req["method"] != "POST":
+            req["response_status"] = 405
+            req.setdefault("response_headers", {})["Allow"] = "POST, OPTIONS"
+            req["response_body"] = json.dumps({"errors": [{"message": "GraphQL requests are sent with POST."}]})
+        elif req["path"] == path:
+            try:
+                data = json.loads(req["request_body"])
+            except ValueError:
+                req["response_status"] = 400
+                req["response_body"] = json.dumps({"errors": [{"message": "The request body isn't valid JSON."}]})
+                return req
+            req["response_body"] = json.dumps(execute(schema, data))
+        elif req["path"] == metrics_path:
+            req["response_body"] = metrics.render()
+            req.setdefault("response_headers", {})["Content-Type"] = "text/plain; version=0.0.4"
+        return req
+
+    http_r = Effect({
+        "type": FX.HTTP.StartServer,
+        "port": port,
+        "bind_address": bind_address,
+        "pipe_into": map[middleware_worker[permit_cors, resolve_gql_query, fallback_not_found, send_response]] | subscribe[run],
+        "logging": False,
+    }) | run
+
+    print(f"Started GQL server at http://localhost:{port}{path}")
+    return http_r
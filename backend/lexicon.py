@@ -0,0 +1,96 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+The word lists used by the resolvers.
+
+make_api.py stores one raw word list per word length on the graph, each under its own
+relation from an ET.WordList node. Each process running the api reads a list from
+there the first time it is needed and keeps it around as a Lexicon, so the resolvers
+never rebuild or scan a list per request, however long it is.
+"""
+import hashlib
+import random
+from threading import Lock
+from zef import *
+from zef.ops import *
+
+
+class Lexicon:
+    """
+    All the words of one length: a frozenset for membership checks and the same
+    words packed back to back in a bytes blob for random picks.
+    """
+    def __init__(self, length: int, words):
+        self.length = length
+        # Keep the order of the source list, it's the order words get picked from
+        ordered = list(dict.fromkeys(w for w in words if len(w) == length and w.isalpha()))
+        self.words = frozenset(ordered)
+        # Position of each word in the list, which is also its row in a pattern table
+        self.index = {w: i for i, w in enumerate(ordered)}
+        self._packed = "".join(ordered).encode("ascii")
+        self.digest = hashlib.sha1(self._packed).hexdigest()[:12]
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word: str):
+        return word in self.words
+
+    def word_at(self, i: int) -> str:
+        return self._packed[i * self.length:(i + 1) * self.length].decode("ascii")
+
+    def random_word(self) -> str:
+        return self.word_at(random.randrange(len(self.words)))
+
+    def ordered(self) -> list:
+        return [self.word_at(i) for i in range(len(self.words))]
+
+
+# The relation each word list hangs off on the graph, by word length
+WORDLISTS = {
+    4: RT.FourLetters,
+    5: RT.FiveLetters,
+    6: RT.SixLetters,
+    7: RT.SevenLetters,
+    8: RT.EightLetters,
+}
+
+_lexicons = {}
+_lock = Lock()
+
+
+def parse_words(text: str) -> list:
+    return [w.strip().upper() for w in text.split("\n") if w.strip()]
+
+
+def lexicon_for(g, length: int = 5) -> Lexicon:
+    """
+    Returns the Lexicon for words of the given length, reading it from the graph on first use.
+    Raises a KeyError for lengths that don't have a word list.
+    """
+    lexicon = _lexicons.get(length)
+    if lexicon is None:
+        rt = WORDLISTS[length]
+        with _lock:
+            lexicon = _lexicons.get(length)
+            if lexicon is None:
+                text = g | all[rt] | first | target | now | value | collect
+                lexicon = _lexicons[length] = Lexicon(length, parse_words(text))
+    return lexicon
@@ -0,0 +1,71 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Serializes the mutations of each duel and the version bumps of each user.
+
+submit_guess, accept_duel and create_game check the state of a duel and then
+commit a transaction based on it. Two of them running at the same time on the same
+duel could both pass the check (a 7th guess, two players accepting the same duel),
+so each of them holds the duel's lock from the moment it reads that state until its
+transaction went through. Mutations of different duels don't wait for each other.
+
+A user's version (see versions.py) is bumped by the mutations of all their duels,
+so the mutations also hold user_locks for the users whose version they bump while
+reading and committing it. They are always taken after the duel's lock and in id
+order, so two mutations can't wait on each other's locks.
+"""
+import threading
+from contextlib import contextmanager, ExitStack
+from weakref import WeakValueDictionary
+
+
+class _Lock:
+    def __init__(self):
+        self.lock = threading.Lock()
+
+
+# A lock goes away once no mutation holds or waits for it
+_locks = WeakValueDictionary()
+_registry_lock = threading.Lock()
+
+
+def _lock_for(key: str) -> _Lock:
+    with _registry_lock:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = _Lock()
+    return lock
+
+
+@contextmanager
+def duel_lock(duel_id: str):
+    lock = _lock_for(duel_id)
+    with lock.lock:
+        yield
+
+
+@contextmanager
+def user_locks(*user_ids):
+    """Holds the lock of each of the users, taken in id order."""
+    held = [_lock_for(user_id) for user_id in sorted(set(user_ids))]
+    with ExitStack() as stack:
+        for lock in held:
+            stack.enter_context(lock.lock)
+        yield
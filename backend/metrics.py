@@ -0,0 +1,201 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Per-field resolver metrics, exposed in the Prometheus text format.
+
+`resolver_middleware` wraps every field resolver of a GraphQL request (gql_server.py
+passes it to graphql_sync) and records, per `Type.field`, the number of calls, the
+graph traversals done through the request's RequestContext and a latency histogram.
+Whole requests are recorded per operation name the same way.
+
+The counters are split over a fixed number of SHARDS, each with its own lock. Each
+thread is handed the next shard in turn the first time it records (thread idents are
+aligned addresses, so they can't pick the shard), so concurrent requests rarely wait
+on each other; `render` adds the shards up when /metrics is scraped. With
+METRICS_SAMPLE_RATE below 1 only that share of the calls is timed (calls are always
+counted). METRICS=0 turns it all off.
+
+Every series carries the `worker` label of its process. With WORKERS the processes
+share port 5010, so each also serves its own /metrics on a port of its own (`serve`,
+see workers.py) for Prometheus to scrape them all.
+"""
+import itertools
+import os
+import random
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from time import perf_counter
+
+METRICS = os.getenv("METRICS", "1") == "1"
+SAMPLE_RATE = float(os.getenv("METRICS_SAMPLE_RATE", "1"))
+# Upper bounds of the histogram buckets, in seconds
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+FIELDS = "field"
+OPERATIONS = "operation"
+# "primary", or "replica<n>" for the replicas workers.py starts
+WORKER = os.getenv("WORKER_ROLE", "primary") + os.getenv("WORKER_INDEX", "")
+
+
+class _Series:
+    __slots__ = ("calls", "traversals", "timed", "seconds", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.traversals = 0
+        self.timed = 0
+        self.seconds = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def observe(self, seconds: float):
+        self.timed += 1
+        self.seconds += seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+
+SHARDS = 16
+
+
+class _Shard:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {FIELDS: {}, OPERATIONS: {}}
+
+
+_shards = [_Shard() for _ in range(SHARDS)]
+_next_shard = itertools.count()
+_local = threading.local()
+
+
+def _shard() -> _Shard:
+    """The shard of the current thread."""
+    shard = getattr(_local, "shard", None)
+    if shard is None:
+        shard = _local.shard = _shards[next(_next_shard) % SHARDS]
+    return shard
+
+
+def record(kind: str, key: str, seconds: float = None, traversals: int = 0):
+    shard = _shard()
+    with shard.lock:
+        series = shard.stats[kind].get(key)
+        if series is None:
+            series = shard.stats[kind][key] = _Series()
+        series.calls += 1
+        series.traversals += traversals
+        if seconds is not None:
+            series.observe(seconds)
+
+
+def operation_label(name: str) -> str:
+    """
+    The label of an operation name sent by a client. Anything that doesn't look like
+    an operation name of ours is counted as "other", so clients can't make the
+    number of series grow without bounds.
+    """
+    if not name:
+        return "anonymous"
+    if len(name) > 64 or not name.isidentifier():
+        return "other"
+    return name
+
+
+def resolver_middleware(next_, root, info, **args):
+    if not METRICS:
+        return next_(root, info, **args)
+    key = f"{info.parent_type.name}.{info.field_name}"
+    context = info.context
+    traversals = getattr(context, "traversals", 0)
+    if SAMPLE_RATE < 1 and random.random() >= SAMPLE_RATE:
+        result = next_(root, info, **args)
+        record(FIELDS, key, None, getattr(context, "traversals", 0) - traversals)
+        return result
+    start = perf_counter()
+    result = next_(root, info, **args)
+    record(FIELDS, key, perf_counter() - start, getattr(context, "traversals", 0) - traversals)
+    return result
+
+
+def _merged(kind: str) -> dict:
+    merged = {}
+    for shard in _shards:
+        with shard.lock:
+            for key, series in shard.stats[kind].items():
+                total = merged.setdefault(key, _Series())
+                total.calls += series.calls
+                total.traversals += series.traversals
+                total.timed += series.timed
+                total.seconds += series.seconds
+                total.buckets = [a + b for a, b in zip(total.buckets, series.buckets)]
+    return merged
+
+
+def _render_family(lines: list, name: str, label: str, merged: dict):
+    lines.append(f"# TYPE worduel_{name}_calls_total counter")
+    for key, s in sorted(merged.items()):
+        lines.append(f'worduel_{name}_calls_total{{worker="{WORKER}",{label}="{key}"}} {s.calls}')
+    lines.append(f"# TYPE worduel_{name}_graph_traversals_total counter")
+    for key, s in sorted(merged.items()):
+        lines.append(f'worduel_{name}_graph_traversals_total{{worker="{WORKER}",{label}="{key}"}} {s.traversals}')
+    lines.append(f"# TYPE worduel_{name}_seconds histogram")
+    for key, s in sorted(merged.items()):
+        labels = f'worker="{WORKER}",{label}="{key}"'
+        cumulative = 0
+        for bound, count in zip(BUCKETS, s.buckets):
+            cumulative += count
+            lines.append(f'worduel_{name}_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'worduel_{name}_seconds_bucket{{{labels},le="+Inf"}} {s.timed}')
+        lines.append(f'worduel_{name}_seconds_sum{{{labels}}} {s.seconds}')
+        lines.append(f'worduel_{name}_seconds_count{{{labels}}} {s.timed}')
+
+
+def render() -> str:
+    """All the metrics of this process, in the Prometheus text exposition format."""
+    lines = []
+    _render_family(lines, "field", "field", _merged(FIELDS))
+    _render_family(lines, "operation", "operation", _merged(OPERATIONS))
+    return "\n".join(lines) + "\n"
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args, **kwds):
+        pass
+
+
+def serve(port: int, bind_address: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """Serves the metrics of this process alone on /metrics of `port`, in a thread of its own."""
+    server = ThreadingHTTPServer((bind_address, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,83 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Relay style connections over the games of a duel and the guesses of a game.
+
+Cursors are the offset of the edge in the full list, base64 encoded so clients
+treat them as opaque. A page is never longer than MAX_PAGE_SIZE (env, 50 by
+default), whatever the client asks for, and without `first` or `last` the first
+MAX_PAGE_SIZE edges are returned. The plain list fields Duel.games and Game.guesses
+are bounded the same way: the latest MAX_PAGE_SIZE games, the first MAX_PAGE_SIZE
+guesses.
+"""
+import os
+from base64 import b64decode, b64encode
+
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "50"))
+
+
+def encode_cursor(kind: str, offset: int) -> str:
+    return b64encode(f"{kind}:{offset}".encode()).decode()
+
+
+def decode_cursor(kind: str, cursor: str):
+    """The offset in the cursor, None if it isn't a cursor of this kind of connection."""
+    try:
+        prefix, offset = b64decode(cursor.encode()).decode().split(":")
+        return int(offset) if prefix == kind else None
+    except Exception:
+        return None
+
+
+def connection(kind: str, items: list, first: int = None, after: str = None, last: int = None, before: str = None) -> dict:
+    """
+    The connection dict of `items` for the given arguments, following the Relay cursor
+    connections specification: `after`/`before` narrow the list, then `first` keeps
+    the edges at its start and `last` the ones at its end.
+    """
+    total = len(items)
+    start, end = 0, total
+    if after is not None:
+        offset = decode_cursor(kind, after)
+        if offset is not None:
+            start = max(start, min(offset + 1, total))
+    if before is not None:
+        offset = decode_cursor(kind, before)
+        if offset is not None:
+            end = min(end, max(offset, start))
+
+    if first is None and last is None:
+        first = MAX_PAGE_SIZE
+    if first is not None:
+        end = min(end, start + max(0, min(first, MAX_PAGE_SIZE)))
+    if last is not None:
+        start = max(start, end - max(0, min(last, MAX_PAGE_SIZE)))
+
+    edges = [{"cursor": encode_cursor(kind, i), "node": items[i]} for i in range(start, end)]
+    return {
+        "edges": edges,
+        "pageInfo": {
+            "hasPreviousPage": start > 0,
+            "hasNextPage": end < total,
+            "startCursor": edges[0]["cursor"] if edges else None,
+            "endCursor": edges[-1]["cursor"] if edges else None,
+        },
+        "totalCount": total,
+    }
@@ -0,0 +1,116 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Precomputed pattern tables.
+
+A pattern table holds the pattern code (see scoring.py) of every guess against every
+solution of a lexicon, as a square matrix indexed by Lexicon.index. Five letter codes
+fit in a uint8, longer words need a uint16.
+
+The tables are built once with
+
+    python pattern_table.py
+
+after make_api.py, and saved as .npy files named after the lexicon's digest, so a
+table can never be used with a word list it wasn't built for. The server memory-maps
+them: startup doesn't read the file, the OS pages it in as rows are used, and all
+the processes on a machine share the same pages.
+"""
+import os
+import numpy as np
+from threading import Lock
+import scoring
+
+TABLE_DIR = os.getenv("PATTERN_TABLE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "pattern_tables"))
+# A table is len(lexicon)**2 entries, which is only reasonable for the smaller lists
+TABLE_LENGTHS = [int(n) for n in os.getenv("PATTERN_TABLE_LENGTHS", "5").split(",")]
+
+
+def table_path(lexicon) -> str:
+    return os.path.join(TABLE_DIR, f"patterns_{lexicon.length}_{lexicon.digest}.npy")
+
+
+def build(lexicon) -> str:
+    """
+    Writes the pattern table of a lexicon one row at a time and returns its path.
+    """
+    words = scoring.encode(lexicon.ordered())
+    dtype = np.uint8 if 3**lexicon.length <= 256 else np.uint16
+    path = table_path(lexicon)
+    os.makedirs(TABLE_DIR, exist_ok=True)
+
+    tmp_path = path + ".tmp"
+    table = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=dtype, shape=(len(words), len(words)))
+    for i in range(len(words)):
+        table[i] = scoring.patterns(words[i], words)
+    table.flush()
+    del table
+    os.replace(tmp_path, path)
+    return path
+
+
+_tables = {}
+_lock = Lock()
+
+
+def table_for(lexicon):
+    """
+    The memory-mapped pattern table of a lexicon, or None if it hasn't been built.
+    """
+    key = (lexicon.length, lexicon.digest)
+    if key not in _tables:
+        with _lock:
+            if key not in _tables:
+                path = table_path(lexicon)
+                _tables[key] = np.load(path, mmap_mode="r") if os.path.exists(path) else None
+    return _tables[key]
+
+
+def lookup(lexicon, guess: str, solution: str):
+    """
+    The pattern code of a guess against a solution read from the table, or None when
+    there is no table or either word isn't part of the lexicon.
+    """
+    table = table_for(lexicon)
+    if table is None:
+        return None
+    i, j = lexicon.index.get(guess), lexicon.index.get(solution)
+    if i is None or j is None:
+        return None
+    return int(table[i, j])
+
+
+def score(lexicon, guess: str, solution: str):
+    """
+    Same as scoring.score, but reads the pattern from the table when it can.
+    """
+    code = lookup(lexicon, guess, solution)
+    if code is None:
+        return scoring.score(guess, solution)
+    return scoring.guess_result(code, guess), scoring.discarded_letters(guess, solution)
+
+
+if __name__ == "__main__":
+    from zef import *
+    from lexicon import lexicon_for
+
+    g = Graph(os.getenv("TAG", "worduel/main3"))
+    for word_length in TABLE_LENGTHS:
+        print(f"Wrote {build(lexicon_for(g, word_length))}")
@@ -0,0 +1,127 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Persisted queries, as sent by Apollo's persisted query link.
+
+Clients send the sha256 of their document instead of the document itself
+(`extensions.persistedQuery.sha256Hash`). The first time a hash is seen the server
+answers PERSISTED_QUERY_NOT_FOUND and the client sends the document along with the
+hash, which registers it. Only the documents of the frontend can be registered:
+persisted_queries.json holds them, normalized (printed without `__typename`, which
+Apollo adds to every selection), and is written from the gql`` documents in src by
+
+    python persisted_queries.py
+
+With PERSISTED_QUERIES_ONLY=1 documents that aren't in it are refused altogether.
+"""
+import json
+import os
+import threading
+
+from graphql import GraphQLError, parse, print_ast
+from graphql.language import Visitor, REMOVE, visit
+
+from query_plans import document_hash
+
+ALLOW_LIST_PATH = os.getenv("PERSISTED_QUERIES_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "persisted_queries.json"))
+PERSISTED_QUERIES_ONLY = os.getenv("PERSISTED_QUERIES_ONLY", "0") == "1"
+# Bound on the hashes registered by clients
+MAX_REGISTERED = 1024
+
+NOT_FOUND = {"message": "PersistedQueryNotFound", "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}
+NOT_ALLOWED = {"message": "This query isn't one of the persisted queries of worduel.", "extensions": {"code": "PERSISTED_QUERY_NOT_ALLOWED"}}
+HASH_MISMATCH = {"message": "provided sha does not match query", "extensions": {"code": "PERSISTED_QUERY_HASH_MISMATCH"}}
+
+
+class _StripTypename(Visitor):
+    def enter_field(self, node, *_args):
+        if node.name.value == "__typename":
+            return REMOVE
+
+
+def normalize(query: str) -> str:
+    """The document printed the same way whatever its formatting and `__typename`s."""
+    return print_ast(visit(parse(query), _StripTypename()))
+
+
+def _load_allow_list(path: str = ALLOW_LIST_PATH) -> frozenset:
+    if not os.path.exists(path):
+        return frozenset()
+    with open(path) as f:
+        return frozenset(json.load(f))
+
+
+_allowed = _load_allow_list()
+_registered = {}
+_lock = threading.Lock()
+
+
+def is_allowed(query: str) -> bool:
+    try:
+        return normalize(query) in _allowed
+    except GraphQLError:
+        return False
+
+
+def resolve(data: dict):
+    """
+    The (query, hash, error) of a request: the query to run and its hash (None if the
+    client didn't send one), or the error to answer with if it can't be run.
+    """
+    query = data.get("query")
+    persisted = (data.get("extensions") or {}).get("persistedQuery") or {}
+    query_hash = persisted.get("sha256Hash")
+
+    if query_hash is None:
+        if PERSISTED_QUERIES_ONLY and not is_allowed(query or ""):
+            return None, None, NOT_ALLOWED
+        return query, None, None
+
+    if not query:
+        with _lock:
+            query = _registered.get(query_hash)
+        if query is None:
+            return None, None, NOT_FOUND
+        return query, query_hash, None
+
+    if not isinstance(query, str) or document_hash(query) != query_hash:
+        return None, None, HASH_MISMATCH
+    if not is_allowed(query):
+        if PERSISTED_QUERIES_ONLY:
+            return None, None, NOT_ALLOWED
+        # Runs, but isn't remembered
+        return query, query_hash, None
+    with _lock:
+        if len(_registered) < MAX_REGISTERED:
+            _registered[query_hash] = query
+    return query, query_hash, None
+
+
+def build(path: str = ALLOW_LIST_PATH) -> str:
+    from bench import operations
+    documents = sorted({normalize(document) for document in operations.documents()})
+    with open(path, "w") as f:
+        json.dump(documents, f, indent=2)
+        f.write("\n")
+    return path
+
+
+if __name__ == "__main__":
+    print(f"Wrote {build()}")
@@ -0,0 +1,161 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Depth and cost analysis of the incoming GraphQL queries, run as a validation rule
+before anything is executed.
+
+The schema is cyclic (User.duels -> Duel.players -> User.duels, Game.duel ->
+Duel.games -> Game.duel), so without limits a small query can make the resolvers
+walk the graph exponentially. Every field that resolves to an object costs 1 (a
+delegate traversal), the fields in FIELD_COSTS cost more, and list fields multiply
+the cost of what is selected under them by their expected length: `first`/`last`
+when given, LIST_SIZES or DEFAULT_LIST_SIZE otherwise. Introspection fields
+(__schema, __type, __typename) are left out of the analysis.
+
+Queries deeper than QUERY_MAX_DEPTH or costlier than QUERY_MAX_COST (env) are
+rejected with an error naming the limit.
+"""
+import os
+
+from graphql import GraphQLError, get_named_type, is_list_type, is_leaf_type, get_nullable_type
+from graphql.language import FieldNode, FragmentSpreadNode, InlineFragmentNode, OperationDefinitionNode, VariableNode
+from graphql.validation import ValidationRule
+
+from pagination import MAX_PAGE_SIZE
+
+QUERY_MAX_DEPTH = int(os.getenv("QUERY_MAX_DEPTH", "10"))
+QUERY_MAX_COST = int(os.getenv("QUERY_MAX_COST", "1000"))
+
+# Fields that do more than follow a relation
+FIELD_COSTS = {
+    "Duel.currentScore": 10,
+    "User.duels": 10,
+    "Game.traceID": 5,
+    "Query.getHints": 50,
+}
+
+# Expected length of list fields that don't take `first`/`last`
+DEFAULT_LIST_SIZE = 10
+LIST_SIZES = {
+    "Duel.players": 2,
+    "Game.guesses": 6,
+    "HintsResponse.hints": 5,
+    "User.duels": MAX_PAGE_SIZE,
+    "Duel.games": MAX_PAGE_SIZE,
+    # The connection field already multiplied by the page size
+    "GameConnection.edges": 1,
+    "GuessConnection.edges": 1,
+}
+
+
+class QueryLimitsRule(ValidationRule):
+    """Reports the operations that go over QUERY_MAX_DEPTH or QUERY_MAX_COST."""
+    # The variables of the request, so `first: $first` counts for what is asked
+    variables = {}
+
+    def enter_operation_definition(self, node: OperationDefinitionNode, *_args):
+        schema = self.context.schema
+        root_type = {
+            "query": schema.query_type,
+            "mutation": schema.mutation_type,
+            "subscription": schema.subscription_type,
+        }[node.operation.value]
+        if root_type is None:
+            return
+        fragments = {f.name.value: f for f in self.context.document.definitions if hasattr(f, "type_condition") and f.name is not None}
+        depth, cost = self._analyse(node.selection_set, root_type, fragments, 0, frozenset())
+
+        name = node.name.value if node.name else "anonymous"
+        if depth > QUERY_MAX_DEPTH:
+            self.report_error(GraphQLError(
+                f"Operation '{name}' is {depth} levels deep, the limit is {QUERY_MAX_DEPTH}.", node))
+        elif cost > QUERY_MAX_COST:
+            self.report_error(GraphQLError(
+                f"Operation '{name}' has a cost of {cost}, the limit is {QUERY_MAX_COST}.", node))
+
+    def _analyse(self, selection_set, parent_type, fragments, depth, visited):
+        """The (depth, cost) of a selection set on `parent_type`."""
+        if selection_set is None:
+            return depth, 0
+        max_depth, total = depth, 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                d, c = self._analyse_field(selection, parent_type, fragments, depth, visited)
+            elif isinstance(selection, InlineFragmentNode):
+                type_ = parent_type
+                if selection.type_condition is not None:
+                    type_ = self.context.schema.get_type(selection.type_condition.name.value) or parent_type
+                d, c = self._analyse(selection.selection_set, type_, fragments, depth, visited)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = fragments.get(name)
+                # Cycles between fragments are reported by the standard rules
+                if fragment is None or name in visited:
+                    continue
+                type_ = self.context.schema.get_type(fragment.type_condition.name.value) or parent_type
+                d, c = self._analyse(fragment.selection_set, type_, fragments, depth, visited | {name})
+            else:
+                continue
+            max_depth, total = max(max_depth, d), total + c
+        return max_depth, total
+
+    def _analyse_field(self, node: FieldNode, parent_type, fragments, depth, visited):
+        name = node.name.value
+        if name.startswith("__"):
+            return depth, 0
+        field = getattr(parent_type, "fields", {}).get(name)
+        if field is None:
+            # Unknown fields are reported by the standard rules
+            return depth, 0
+        key = f"{parent_type.name}.{name}"
+        field_type = get_nullable_type(field.type)
+        named_type = get_named_type(field_type)
+
+        own_cost = FIELD_COSTS.get(key, 0 if is_leaf_type(named_type) else 1)
+        if node.selection_set is None:
+            return depth + 1, own_cost
+
+        d, children_cost = self._analyse(node.selection_set, named_type, fragments, depth + 1, visited)
+        return d, own_cost + self._multiplier(node, key, field_type) * children_cost
+
+    def _multiplier(self, node: FieldNode, key: str, field_type) -> int:
+        arguments = {a.name.value: a.value for a in node.arguments or []}
+        for arg in ("first", "last"):
+            value = arguments.get(arg)
+            if value is None:
+                continue
+            if isinstance(value, VariableNode):
+                value = self.variables.get(value.name.value)
+            else:
+                value = value.value
+            try:
+                return min(int(value), MAX_PAGE_SIZE)
+            except (TypeError, ValueError):
+                return MAX_PAGE_SIZE
+        if key.endswith("Connection"):
+            return MAX_PAGE_SIZE
+        if is_list_type(field_type):
+            return LIST_SIZES.get(key, DEFAULT_LIST_SIZE)
+        return 1
+
+
+def query_limits_rules(variables: dict) -> list:
+    """The validation rules for a request with these variables, to pass to graphql-core's validate()."""
+    return [type("QueryLimitsRule", (QueryLimitsRule,), {"variables": variables})]
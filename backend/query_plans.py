@@ -0,0 +1,68 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Cache of parsed and validated GraphQL documents.
+
+The frontend sends the same few documents over and over, so parsing them and
+validating them against the schema is done once per document: the result is kept in
+an LRU keyed by the sha256 of the document (QUERY_PLAN_CACHE_SIZE entries, 256 by
+default). Only the depth and cost limits of query_limits.py, which depend on the
+request's variables, are checked on every request.
+"""
+import hashlib
+import os
+
+from graphql import GraphQLError, parse, validate, specified_rules
+
+from lru import LRU
+
+QUERY_PLAN_CACHE_SIZE = int(os.getenv("QUERY_PLAN_CACHE_SIZE", "256"))
+
+
+def document_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class Plan:
+    """A parsed document and the errors of its validation against the schema."""
+    __slots__ = ("document", "errors")
+
+    def __init__(self, document, errors: list):
+        self.document = document
+        self.errors = errors
+
+
+class PlanCache:
+    def __init__(self, schema, size: int = QUERY_PLAN_CACHE_SIZE):
+        self.schema = schema
+        self._plans = LRU(size)
+
+    def plan_for(self, query: str, query_hash: str = None) -> Plan:
+        key = query_hash or document_hash(query)
+        plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+        try:
+            document = parse(query)
+        except GraphQLError as error:
+            # Syntax errors aren't worth keeping
+            return Plan(None, [error])
+        plan = Plan(document, validate(self.schema, document, specified_rules))
+        return self._plans.put(key, plan)
@@ -0,0 +1,96 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Per-request memoization of graph traversals.
+
+Resolving a single getDuel walks the same relations again and again: the duel's
+games for `games`, `currentGame` and `gamesConnection`, every game's player and
+creator, the participants' names for `currentScore`, ... gql_server.py passes a
+fresh RequestContext as the context of each request, which the field resolvers
+reach through `ctx.context` and use for their traversals, so each relation of each
+entity is followed at most once per request.
+
+`traversals` counts the relations actually followed and `hits` the ones answered
+from the memo. With TRAVERSAL_STATS=1 both are returned in the response's
+`extensions`.
+"""
+import os
+
+from zef import *
+from zef.ops import *
+
+TRAVERSAL_STATS = os.getenv("TRAVERSAL_STATS", "0") == "1"
+
+
+class RequestContext:
+    def __init__(self):
+        self.traversals = 0
+        self.hits = 0
+        self._memo = {}
+
+    def _memoized(self, key, compute):
+        if key in self._memo:
+            self.hits += 1
+            return self._memo[key]
+        self.traversals += 1
+        result = self._memo[key] = compute()
+        return result
+
+    def outs(self, z, rt) -> list:
+        """The targets of the `rt` relations out of z, as `z >> L[rt]`."""
+        return self._memoized((str(origin_uid(z)), str(rt), ">>"), lambda: list(z >> L[rt] | collect))
+
+    def ins(self, z, rt) -> list:
+        """The sources of the `rt` relations into z, as `z << L[rt]`."""
+        return self._memoized((str(origin_uid(z)), str(rt), "<<"), lambda: list(z << L[rt] | collect))
+
+    def out(self, z, rt):
+        """The target of the optional `rt` relation out of z, None if it has none."""
+        targets = self.outs(z, rt)
+        return targets[0] if targets else None
+
+    def into(self, z, rt):
+        """The source of the optional `rt` relation into z, None if it has none."""
+        sources = self.ins(z, rt)
+        return sources[0] if sources else None
+
+    def value(self, z, rt):
+        """The value of the optional `rt` attribute of z, None if it has none."""
+        target = self.out(z, rt)
+        return None if target is None else value(target)
+
+    def values(self, z, rt) -> list:
+        """The values of all the `rt` attributes of z, in order."""
+        return [value(target) for target in self.outs(z, rt)]
+
+    def stats(self) -> dict:
+        return {"graphTraversals": self.traversals, "memoHits": self.hits}
+
+
+def context_of(ctx) -> RequestContext:
+    """
+    The RequestContext of the request being resolved, given the `ctx` a resolver gets.
+    Outside of gql_server.py (no such context) a fresh one is returned, which then
+    only memoizes within the resolver.
+    """
+    context = getattr(ctx, "context", None)
+    if isinstance(context, RequestContext):
+        return context
+    return RequestContext()
@@ -23,17 +23,44 @@ from zef.ops import *
 from zef.gql import *
 from time import sleep
 import os
+import events
+import gql_server
+import workers
+import snapshot
+import metrics
+import scoreboard
 
 worduel_tag = os.getenv('TAG', "worduel/main3")
 if __name__ == "__main__":
-    g = Graph(worduel_tag)
-    make_primary(g, True)  # To be able to perform mutations locally without needing to send merge requests
-    Effect({
-        "type": FX.GraphQL.StartServer,
-        "schema_root": gql_schema(g),
-        "port": 5010,
-        "bind_address": "0.0.0.0",
-    }) | run
+    if workers.ROLE == "replica":
+        # Read only view of the graph, mutations are forwarded to the primary, see workers.py
+        workers.run_replica(Graph(worduel_tag), 5010)
+
+    snapshot_path = os.getenv("SNAPSHOT")
+    if snapshot_path:
+        # Local graph prebuilt by snapshot.py, no network needed, see snapshot.py
+        # Nothing written to it is kept, so it is only for benchmarks and tests
+        if not snapshot.EPHEMERAL:
+            raise SystemExit("SNAPSHOT serves an unsynced graph and loses every write on exit, set SNAPSHOT_EPHEMERAL=1 to use it anyway")
+        if workers.WORKERS > 0:
+            raise SystemExit("WORKERS needs the graph to be synced to zefhub, it can't be used with SNAPSHOT")
+        g = snapshot.load(snapshot_path)
+        print(f"Serving the ephemeral graph of {snapshot_path}: users, duels and guesses are lost on exit")
+    else:
+        g = Graph(worduel_tag)
+        make_primary(g, True)  # To be able to perform mutations locally without needing to send merge requests
+        # Replicas never save the scoreboards they rebuild, see scoreboard.py
+        scoreboard.start_backfill(g)
+    # Queries go through the depth and cost limits of query_limits.py, see gql_server.py
+    if workers.WORKERS > 0:
+        gql_server.start_server(g, workers.PRIMARY_PORT, "127.0.0.1")
+        # Port 5010 is shared by the replicas, each process has its own metrics port
+        metrics.serve(workers.METRICS_PORT)
+        workers.spawn_replicas(workers.WORKERS)
+    else:
+        gql_server.start_server(g, 5010, "0.0.0.0")
+    # Duel changes are pushed to the clients from here, see events.py
+    events.start_server(events.EVENTS_PORT)
     
     while True: sleep(1)
 # %%
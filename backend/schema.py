@@ -23,6 +23,10 @@ type Query {
   getGame(gameId: ID): Game
   getDuel(duelId: ID): Duel
   getRandomWord(length: Int): String
+  getUserIfChanged(userId: ID, version: String): UserResponse
+  getGameIfChanged(gameId: ID, version: String): GameResponse
+  getDuelIfChanged(duelId: ID, version: String): DuelResponse
+  getHints(gameId: ID): HintsResponse
 }
 
 type Mutation {
@@ -31,12 +35,15 @@ type Mutation {
     createDuel(creatorId: ID): ID 
     createGame(solution: String, duelId: ID, creatorId: ID): CreateGameReturnType 
     submitGuess(gameId: ID, guess: String): SubmitGuessReturnType
+    createUsers(names: [String]): CreateBatchReturnType
+    createDuels(creatorIds: [ID], playerIds: [ID], solutions: [String]): CreateBatchReturnType
 }
 
 type User {
  id: ID
  name: String
- duels: [Duel]
+ duels(since: Datetime, first: Int, after: ID): [Duel]
+ version: String
 }
 
 type Game {
@@ -48,14 +55,47 @@ type Game {
  solution:  String
  traceID:   String
  guesses: [String]
+ guessesConnection(first: Int, after: String, last: Int, before: String): GuessConnection
+ version: String
 }
 
 type Duel {
  id: ID
  players: [User]
  games:   [Game]
+ gamesConnection(first: Int, after: String, last: Int, before: String): GameConnection
  currentGame: Game
  currentScore: [Score]
+ version: String
+}
+
+type PageInfo {
+  hasPreviousPage: Boolean
+  hasNextPage:     Boolean
+  startCursor:     String
+  endCursor:       String
+}
+
+type GameEdge {
+  cursor: String
+  node:   Game
+}
+
+type GameConnection {
+  edges:      [GameEdge]
+  pageInfo:   PageInfo
+  totalCount: Int
+}
+
+type GuessEdge {
+  cursor: String
+  node:   String
+}
+
+type GuessConnection {
+  edges:      [GuessEdge]
+  pageInfo:   PageInfo
+  totalCount: Int
 }
 
 type Score {
@@ -73,12 +113,47 @@ type SubmitGuessReturnType {
   message:          String
 }
 
+type UserResponse {
+  modified: Boolean
+  version:  String
+  user:     User
+}
+
+type GameResponse {
+  modified: Boolean
+  version:  String
+  game:     Game
+}
+
+type DuelResponse {
+  modified: Boolean
+  version:  String
+  duel:     Duel
+}
+
+type Hint {
+  word:             String
+  bits:             Float
+  possibleSolution: Boolean
+}
+
+type HintsResponse {
+  remaining: Int
+  hints:     [Hint]
+}
+
 type CreateGameReturnType {
   success: Boolean
   message: String
   id:      ID  
 }
 
+type CreateBatchReturnType {
+  success: Boolean
+  message: String
+  ids:     [ID]
+}
+
 scalar ID
 scalar Datetime
 """
@@ -0,0 +1,144 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+The running score of each duel.
+
+Every duel carries its scoreboard as a JSON string under RT.Scoreboard, mapping each
+player's id to their points. submit_guess updates it in the same transaction that
+completes a game, so reading the score is a lookup per player instead of a walk over
+every game of the duel. Duels that don't have a scoreboard yet (e.g. created before
+it existed) get theirs rebuilt from their games the first time their score is read,
+and saved so later reads are lookups too. Only the primary saves it: with WORKERS the
+queries never reach the primary, so run_api.py also has it `backfill` the scoreboards
+of all such duels at startup, and replicas only rebuild them until that has synced.
+Games completed without a player (nobody had accepted the duel) score for no one.
+"""
+import json
+import threading
+from zef import *
+from zef.ops import *
+
+MAX_POINTS = 7
+
+
+def game_points(game):
+    """
+    The player of a completed game and the points they scored: 7 minus the number of
+    guesses if they found the solution, 0 otherwise. None if the game isn't completed.
+    """
+    if not value(game >> RT.Completed):
+        return None
+    player = game >> O[RT.Player] | collect
+    if player is None:
+        return None
+    player = str(origin_uid(player))
+    solution = game >> RT.Solution | value | collect
+    guesses = game >> L[RT.Guess] | value | collect
+    if guesses and to_upper_case(guesses[-1]) == solution:
+        return player, MAX_POINTS - len(guesses)
+    return player, 0
+
+
+def rebuild(duel) -> dict:
+    points = {}
+    for game in duel >> L[RT.Game]:
+        result = game_points(game)
+        if result is not None:
+            player, p = result
+            points[player] = points.get(player, 0) + p
+    return points
+
+
+def save_rebuilt(g, duel_id: str) -> dict:
+    """Rebuilds the scoreboard of a duel that has none and commits it."""
+    from locks import duel_lock
+    from commit import commit
+    with duel_lock(duel_id):
+        duel = now(g)[duel_id]
+        scoreboard = duel >> O[RT.Scoreboard] | collect
+        if scoreboard is not None:
+            return json.loads(value(scoreboard))
+        points = rebuild(duel)
+        commit(g, [(duel, RT.Scoreboard, json.dumps(points))], keys=[duel_id])
+        return points
+
+
+def backfill(g) -> int:
+    """Saves the scoreboard of every duel that has none yet, returns how many were saved."""
+    missing = [str(origin_uid(duel)) for duel in g | now | all[ET.Duel] | collect
+               if (duel >> O[RT.Scoreboard] | collect) is None]
+    for duel_id in missing:
+        save_rebuilt(g, duel_id)
+    return len(missing)
+
+
+def start_backfill(g) -> threading.Thread:
+    """Runs backfill in the background, so the server starts without waiting for it."""
+    thread = threading.Thread(target=backfill, args=(g,), daemon=True)
+    thread.start()
+    return thread
+
+
+def load(duel, g=None) -> dict:
+    """The points of each player of the duel. Given the graph, a rebuilt scoreboard is saved to it."""
+    scoreboard = duel >> O[RT.Scoreboard] | collect
+    if scoreboard is None:
+        import workers
+        if g is None or workers.ROLE == "replica":
+            return rebuild(duel)
+        return save_rebuilt(g, str(origin_uid(duel)))
+    return json.loads(value(scoreboard))
+
+
+def current_score(duel, context=None, g=None) -> list:
+    """
+    The score of each participant of the duel. With the RequestContext of the request,
+    the participants and their names are read through it.
+    """
+    if context is None:
+        from request_context import RequestContext
+        context = RequestContext()
+    points = load(duel, g)
+    return [
+        {"userName": context.value(u, RT.Name), "score": points.get(str(origin_uid(u)), 0)}
+        for u in context.outs(duel, RT.Participant)
+    ]
+
+
+def completion_changes(game, player: str, points: int) -> list:
+    """
+    The changes to add to the transaction completing a game, so the duel's scoreboard
+    includes that game's points. None for the player of a game nobody has accepted.
+    """
+    if player is None:
+        return []
+    duel = game << RT.Game | collect
+    scoreboard = duel >> O[RT.Scoreboard] | collect
+    if scoreboard is None:
+        board = rebuild(duel)
+    elif points == 0:
+        return []
+    else:
+        board = json.loads(value(scoreboard))
+    board[player] = board.get(player, 0) + points
+
+    if scoreboard is None:
+        return [(duel, RT.Scoreboard, json.dumps(board))]
+    return [(scoreboard <= json.dumps(board))]
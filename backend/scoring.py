@@ -0,0 +1,119 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Scoring of guesses against solutions.
+
+A guess is scored letter by letter from left to right. A letter in the right spot
+is returned as is, a letter that is somewhere else in the solution is returned as
+"[X]" and consumes the right-most unused occurrence of that letter, anything else
+is returned as "_". Letters that don't appear in the solution at all are the
+discarded letters.
+
+The same result can be packed into a base-3 pattern code, with position i worth
+3**i times ABSENT, PRESENT or EXACT. patterns() computes these codes for whole
+batches of encoded words at once with numpy, for when we need to score a guess
+against every word of a lexicon rather than a single solution.
+"""
+import numpy as np
+
+ABSENT, PRESENT, EXACT = 0, 1, 2
+
+
+def digits(guess: str, solution: str) -> list:
+    """
+    ABSENT, PRESENT or EXACT for each letter of the guess.
+    """
+    remaining = bytearray(solution.encode("ascii"))
+    out = []
+    for i, c in enumerate(guess.encode("ascii")):
+        if remaining[i] == c:
+            remaining[i] = 0
+            out.append(EXACT)
+        else:
+            j = remaining.rfind(c)
+            if j >= 0:
+                remaining[j] = 0
+                out.append(PRESENT)
+            else:
+                out.append(ABSENT)
+    return out
+
+
+def score(guess: str, solution: str):
+    """
+    Returns the guessResult and discardedLetters for a guess, as submitGuess reports them.
+    """
+    return guess_result(pattern(guess, solution), guess), discarded_letters(guess, solution)
+
+
+def discarded_letters(guess: str, solution: str) -> list:
+    return [c for c in dict.fromkeys(guess) if c not in solution]
+
+
+def pattern(guess: str, solution: str) -> int:
+    return sum(d * 3**i for i, d in enumerate(digits(guess, solution)))
+
+
+def guess_result(code: int, guess: str) -> list:
+    """
+    Turns a pattern code back into the guessResult of that guess.
+    """
+    out = []
+    for c in guess:
+        code, digit = divmod(code, 3)
+        out.append(c if digit == EXACT else f"[{c}]" if digit == PRESENT else "_")
+    return out
+
+
+def encode(words) -> np.ndarray:
+    """
+    Encodes equal length words as a (len(words), length) array of letters 0-25.
+    """
+    words = list(words)
+    length = len(words[0]) if words else 0
+    buffer = "".join(words).encode("ascii")
+    return (np.frombuffer(buffer, dtype=np.uint8).reshape(len(words), length) - ord("A")).astype(np.uint8)
+
+
+def patterns(guesses: np.ndarray, solutions: np.ndarray) -> np.ndarray:
+    """
+    Pattern codes of encoded guesses against encoded solutions. Either side can be a
+    single word (1d) or a batch (2d), batches of the same size are scored pairwise.
+    """
+    guesses, solutions = np.broadcast_arrays(np.atleast_2d(guesses), np.atleast_2d(solutions))
+    n, length = guesses.shape
+    rows = np.arange(n)
+    remaining = np.ones((n, length), dtype=bool)
+    codes = np.zeros(n, dtype=np.int32)
+
+    for i in range(length):
+        letter = guesses[:, i]
+        exact = remaining[:, i] & (solutions[:, i] == letter)
+        remaining[exact, i] = False
+
+        # Otherwise consume the right-most unused occurrence of the letter
+        present = remaining & (solutions == letter[:, None])
+        present[exact] = False
+        found = present.any(axis=1)
+        last = length - 1 - np.argmax(present[:, ::-1], axis=1)
+        remaining[rows[found], last[found]] = False
+
+        codes += 3**i * np.where(exact, EXACT, np.where(found, PRESENT, ABSENT)).astype(np.int32)
+    return codes
@@ -0,0 +1,126 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+A self-contained snapshot of the worduel graph in a single file, for benchmarks.
+
+make_api.py needs the network (zefhub and the word list downloads) and takes a while,
+so for repeatable benchmark runs its graph (schema, resolvers, word lists) is written
+once to a snapshot file. run_api.py started with SNAPSHOT=<path> loads the graph from
+that file instead, without any network access. Deployments still load the tagged
+graph from zefhub: zef has no way to attach a graph made from bytes to a tag and sync
+it afterwards.
+
+The loaded graph is local and isn't synced or tagged: everything the API writes to
+it (users, duels, guesses) is gone when the process exits. That is what benchmarks
+want, repeatable runs from the same state, but not what a deployment wants, so
+run_api.py refuses SNAPSHOT unless SNAPSHOT_EPHEMERAL=1 says that's understood.
+
+The file is made of:
+
+    MAGIC (8 bytes) | header length (4 bytes, big endian) | header (JSON) | blobs
+
+where the header holds the format version, the tag and zef version the snapshot was
+made from, and the offset, length and sha256 of each blob of the graph's bytes.
+
+    python snapshot.py [path]        writes the snapshot of the graph tagged TAG
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+
+from zef import *
+from zef.ops import *
+from zef.core import internals
+
+MAGIC = b"WDLSNAP\0"
+FORMAT_VERSION = 1
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "worduel.snapshot"))
+# Acknowledges that a server started from a snapshot keeps nothing it is sent
+EPHEMERAL = os.getenv("SNAPSHOT_EPHEMERAL") == "1"
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def write(g, path: str = SNAPSHOT_PATH, tag: str = None) -> str:
+    import zef
+    payload = internals.graph_as_UpdatePayload(g)
+    blobs = [json.dumps(payload.j).encode("utf-8"), *payload.rest]
+    entries, offset = [], 0
+    for blob in blobs:
+        entries.append({"offset": offset, "length": len(blob), "sha256": hashlib.sha256(blob).hexdigest()})
+        offset += len(blob)
+    header = json.dumps({
+        "format_version": FORMAT_VERSION,
+        "zef_version": zef.__version__,
+        "tag": tag,
+        "created": time.time(),
+        "blobs": entries,
+    }).encode("utf-8")
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack(">I", len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    # Readers never see a half written snapshot
+    os.replace(tmp, path)
+    return path
+
+
+def read_header(path: str = SNAPSHOT_PATH) -> dict:
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise SnapshotError(f"{path} isn't a worduel snapshot")
+        (length,) = struct.unpack(">I", f.read(4))
+        header = json.loads(f.read(length))
+    if header.get("format_version") != FORMAT_VERSION:
+        raise SnapshotError(f"{path} has format version {header.get('format_version')}, expected {FORMAT_VERSION}")
+    return header
+
+
+def load(path: str = SNAPSHOT_PATH):
+    """The graph of the snapshot, a local graph that isn't synced to zefhub."""
+    header = read_header(path)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        f.seek(len(MAGIC))
+        (length,) = struct.unpack(">I", f.read(4))
+        start = len(MAGIC) + 4 + length
+        blobs = []
+        for entry in header["blobs"]:
+            blob = data[start + entry["offset"]:start + entry["offset"] + entry["length"]]
+            if hashlib.sha256(blob).hexdigest() != entry["sha256"]:
+                raise SnapshotError(f"{path} is corrupted")
+            blobs.append(blob)
+    payload = internals.UpdatePayload(json.loads(blobs[0]), blobs[1:])
+    return internals.create_graph_from_bytes(payload, internals.MMAP_STYLE_ANONYMOUS)
+
+
+if __name__ == "__main__":
+    tag = os.getenv("TAG", "worduel/main3")
+    path = sys.argv[1] if len(sys.argv) > 1 else SNAPSHOT_PATH
+    print(f"Wrote {write(Graph(tag), path, tag)}")
@@ -0,0 +1,155 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Hints: which words are still possible in a game and what to guess next.
+
+Each game keeps its candidate set, the words of its lexicon that agree with every
+guess made so far, as a bitset over the lexicon's rows (np.packbits of a boolean
+mask). Only the guesses that were made since the set was last used are applied to
+it: a word stays a candidate if the guess scores the same pattern against it as
+against the solution, which is one row of the pattern table when there is one and
+one batch of scoring.patterns() otherwise. The sets are kept in an LRU of
+SOLVER_GAMES games (10000 by default), a completed game's set is dropped.
+
+Guesses are ranked by the entropy of the patterns they would score against the
+remaining candidates, i.e. the information the guess is expected to give. Scoring
+every word against every candidate is too slow at the start of a game, so the
+candidates are sampled down to SAMPLE_SOLUTIONS and only as many guesses as fit in
+SOLVER_BUDGET pattern lookups (and at most MAX_GUESS_POOL) are ranked: the candidates first, then a sample of
+the other words. With the default budget a call stays well under 50ms.
+"""
+import os
+import numpy as np
+import scoring
+import pattern_table
+from lru import LRU
+
+SOLVER_GAMES = int(os.getenv("SOLVER_GAMES", "10000"))
+SOLVER_BUDGET = int(os.getenv("SOLVER_BUDGET", "200000"))
+SAMPLE_SOLUTIONS = 500
+MAX_GUESS_POOL = 1000
+MAX_HINTS = 5
+# Scoring without a table is much slower than reading it
+UNTABLED_BUDGET_SHARE = 10
+
+_games = LRU(SOLVER_GAMES)
+_encoded = {}
+
+
+def _encoded_words(lexicon) -> np.ndarray:
+    key = (lexicon.length, lexicon.digest)
+    if key not in _encoded:
+        _encoded[key] = scoring.encode(lexicon.ordered())
+    return _encoded[key]
+
+
+def _row(lexicon, guess: str) -> np.ndarray:
+    """The pattern codes of a guess against every word of the lexicon."""
+    table = pattern_table.table_for(lexicon)
+    i = lexicon.index.get(guess)
+    if table is not None and i is not None:
+        return np.asarray(table[i])
+    return scoring.patterns(scoring.encode([guess]), _encoded_words(lexicon))
+
+
+def candidates(game_id: str, lexicon, solution: str, guesses: list) -> np.ndarray:
+    """
+    The boolean mask of the words that are still possible after the guesses, narrowed
+    from the one kept for the game by the guesses it hasn't seen yet.
+    """
+    state = _games.get(game_id)
+    if state is not None and state[1] <= len(guesses):
+        packed, applied = state
+        mask = np.unpackbits(packed, count=len(lexicon)).astype(bool)
+    else:
+        mask, applied = np.ones(len(lexicon), dtype=bool), 0
+
+    for guess in guesses[applied:]:
+        mask &= _row(lexicon, guess) == scoring.pattern(guess, solution)
+
+    _games.put(game_id, (np.packbits(mask), len(guesses)))
+    return mask
+
+
+def forget(game_id: str):
+    _games.pop(game_id)
+
+
+def _entropies(lexicon, guess_rows: np.ndarray, solution_rows: np.ndarray) -> np.ndarray:
+    n_codes = 3**lexicon.length
+    table = pattern_table.table_for(lexicon)
+    if table is not None:
+        codes = np.asarray(table[np.ix_(guess_rows, solution_rows)], dtype=np.int64)
+    else:
+        words = _encoded_words(lexicon)
+        codes = scoring.patterns(
+            np.repeat(words[guess_rows], len(solution_rows), axis=0),
+            np.tile(words[solution_rows], (len(guess_rows), 1)),
+        ).reshape(len(guess_rows), len(solution_rows)).astype(np.int64)
+
+    # Count the (guess, pattern) pairs that occur rather than all 3**length patterns
+    offsets = np.arange(len(guess_rows), dtype=np.int64)[:, None] * n_codes
+    keys, counts = np.unique((codes + offsets).ravel(), return_counts=True)
+    p = counts / len(solution_rows)
+    return np.bincount(keys // n_codes, weights=-p * np.log2(p), minlength=len(guess_rows))
+
+
+def best_guesses(lexicon, mask: np.ndarray, k: int = MAX_HINTS) -> list:
+    """
+    Up to k (word, bits, is_candidate) tuples, best guess first. bits is the expected
+    information of the guess, in bits.
+    """
+    remaining = np.flatnonzero(mask)
+    if len(remaining) <= 2:
+        # Guessing a candidate is at least as good as anything else
+        return [(lexicon.word_at(i), float(len(remaining) - 1), True) for i in remaining[:k]]
+
+    # Seeded by the candidates so a game gets the same hints until its next guess
+    rng = np.random.default_rng(len(remaining) * 7919 + int(remaining[0]))
+    solution_rows = remaining
+    if len(solution_rows) > SAMPLE_SOLUTIONS:
+        solution_rows = np.sort(rng.choice(solution_rows, SAMPLE_SOLUTIONS, replace=False))
+
+    budget = SOLVER_BUDGET
+    if pattern_table.table_for(lexicon) is None:
+        budget //= UNTABLED_BUDGET_SHARE
+    n_guesses = min(MAX_GUESS_POOL, max(k, budget // len(solution_rows)))
+    if n_guesses < len(remaining):
+        guess_rows = rng.choice(remaining, n_guesses, replace=False)
+    else:
+        others = np.flatnonzero(~mask)
+        extra = min(len(others), n_guesses - len(remaining))
+        guess_rows = np.concatenate([remaining, rng.choice(others, extra, replace=False)])
+
+    bits = _entropies(lexicon, guess_rows, solution_rows)
+    is_candidate = mask[guess_rows]
+    # A candidate can also end the game, which breaks ties in its favour
+    order = np.lexsort((~is_candidate, -bits))[:k]
+    return [(lexicon.word_at(int(guess_rows[i])), round(float(bits[i]), 3), bool(is_candidate[i])) for i in order]
+
+
+def hints(game_id: str, lexicon, solution: str, guesses: list, k: int = MAX_HINTS) -> dict:
+    """The HintsResponse of a game that is still being played."""
+    mask = candidates(game_id, lexicon, solution, guesses)
+    return {
+        "remaining": int(mask.sum()),
+        "hints": [{"word": word, "bits": bits, "possibleSolution": possible}
+                  for word, bits, possible in best_guesses(lexicon, mask, k)],
+    }
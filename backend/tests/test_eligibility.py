@@ -0,0 +1,45 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+from types import SimpleNamespace
+
+from eligibility import check, message, Reason
+
+LEXICON = SimpleNamespace(words=frozenset({"ABIDE", "SPEED", "HELLO"}))
+
+
+def test_check_reasons():
+    assert check("ABIDE", 5, LEXICON, set()) == Reason.ELIGIBLE
+    assert check("ABID", 5, LEXICON, set()) == Reason.WRONG_LENGTH
+    assert check("ABIDES", 5, LEXICON, set()) == Reason.WRONG_LENGTH
+    assert check("ZZZZZ", 5, LEXICON, set()) == Reason.NOT_IN_WORDLIST
+    assert check("SPEED", 5, LEXICON, {"SPEED"}) == Reason.REPEATED
+
+
+def test_check_order_matches_submit_guess():
+    # A guess of the wrong length is reported as such even if it's also repeated
+    assert check("ABID", 5, LEXICON, {"ABID"}) == Reason.WRONG_LENGTH
+    assert check("ZZZZZ", 5, LEXICON, {"ZZZZZ"}) == Reason.NOT_IN_WORDLIST
+
+
+def test_messages():
+    assert message(Reason.WRONG_LENGTH, 5) == "Guess isn't 5 characters long."
+    assert message(Reason.NOT_IN_WORDLIST, 5) == "Guess isn't in the wordlist."
+    assert message(Reason.REPEATED, 5) == "You made this guess before!"
+    assert message(Reason.ELIGIBLE, 5) == ""
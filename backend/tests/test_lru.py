@@ -0,0 +1,95 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import threading
+
+from lru import LRU
+
+
+def test_least_recently_used_goes_first():
+    cache = LRU(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_put_returns_the_entry_and_replaces():
+    cache = LRU(2)
+    assert cache.put("a", 1) == 1
+    cache.put("a", 2)
+    assert cache.get("a") == 2
+    assert len(cache) == 1
+
+
+def test_get_and_pop_defaults():
+    cache = LRU(2)
+    assert cache.get("missing") is None
+    assert cache.get("missing", 0) == 0
+    assert "missing" not in cache
+    cache.put("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+
+
+def test_expired_entries_go_when_another_is_added():
+    cache = LRU(10, expired=lambda entry: entry["stale"])
+    old = cache.put("old", {"stale": False})
+    cache.put("fresh", {"stale": False})
+    old["stale"] = True
+    cache.put("new", {"stale": False})
+    assert "old" not in cache
+    assert "fresh" in cache and "new" in cache
+
+
+def test_expiry_stops_at_the_first_live_entry():
+    cache = LRU(10, expired=lambda entry: entry["stale"])
+    cache.put("live", {"stale": False})
+    stale = cache.put("stale", {"stale": False})
+    stale["stale"] = True
+    cache.put("new", {"stale": False})
+    # Only the oldest entries are looked at
+    assert "stale" in cache
+
+
+def test_the_entry_just_added_is_kept_even_if_expired():
+    cache = LRU(10, expired=lambda entry: True)
+    cache.put("a", {})
+    cache.put("b", {})
+    assert "a" not in cache
+    assert "b" in cache
+
+
+def test_threads():
+    cache = LRU(50)
+
+    def work(n):
+        for i in range(2000):
+            cache.put((n, i % 100), i)
+            cache.get((n, (i * 7) % 100))
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(cache) == 50
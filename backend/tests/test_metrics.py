@@ -0,0 +1,70 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import threading
+
+import metrics
+
+
+def used_shards() -> int:
+    return sum(1 for shard in metrics._shards if shard.stats[metrics.FIELDS].get("Test.spread"))
+
+
+def test_threads_spread_over_the_shards():
+    barrier = threading.Barrier(50)
+
+    def work():
+        # All alive at once, so their idents are as close as they get
+        barrier.wait()
+        metrics.record(metrics.FIELDS, "Test.spread", 0.001)
+
+    threads = [threading.Thread(target=work) for _ in range(50)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert used_shards() == metrics.SHARDS
+    assert metrics._merged(metrics.FIELDS)["Test.spread"].calls == 50
+
+
+def test_a_thread_keeps_its_shard():
+    metrics.record(metrics.FIELDS, "Test.same", 0.001)
+    metrics.record(metrics.FIELDS, "Test.same", 0.001)
+    assert [s.stats[metrics.FIELDS]["Test.same"].calls for s in metrics._shards if "Test.same" in s.stats[metrics.FIELDS]] == [2]
+
+
+def test_render():
+    metrics.record(metrics.OPERATIONS, "GetDuel", 0.003, traversals=4)
+    metrics.record(metrics.OPERATIONS, "GetDuel", None, traversals=1)
+    text = metrics.render()
+    labels = f'worker="{metrics.WORKER}",operation="GetDuel"'
+    assert f"worduel_operation_calls_total{{{labels}}} 2\n" in text
+    assert f"worduel_operation_graph_traversals_total{{{labels}}} 5\n" in text
+    assert f'worduel_operation_seconds_bucket{{{labels},le="0.0025"}} 0\n' in text
+    assert f'worduel_operation_seconds_bucket{{{labels},le="0.005"}} 1\n' in text
+    assert f'worduel_operation_seconds_bucket{{{labels},le="+Inf"}} 1\n' in text
+    assert f"worduel_operation_seconds_count{{{labels}}} 1\n" in text
+    assert text.count("# TYPE worduel_operation_seconds histogram") == 1
+
+
+def test_operation_label():
+    assert metrics.operation_label(None) == "anonymous"
+    assert metrics.operation_label("GetDuel") == "GetDuel"
+    assert metrics.operation_label("not a name") == "other"
+    assert metrics.operation_label("x" * 65) == "other"
@@ -0,0 +1,80 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import pagination
+from pagination import connection, decode_cursor, encode_cursor, MAX_PAGE_SIZE
+
+ITEMS = list(range(10))
+
+
+def nodes(conn):
+    return [edge["node"] for edge in conn["edges"]]
+
+
+def test_cursors_round_trip_and_are_checked():
+    cursor = encode_cursor("game", 3)
+    assert decode_cursor("game", cursor) == 3
+    assert decode_cursor("guess", cursor) is None
+    assert decode_cursor("game", "not a cursor") is None
+
+
+def test_first_and_after_page_forward():
+    page = connection("game", ITEMS, first=4)
+    assert nodes(page) == [0, 1, 2, 3]
+    assert page["pageInfo"] == {
+        "hasPreviousPage": False,
+        "hasNextPage": True,
+        "startCursor": encode_cursor("game", 0),
+        "endCursor": encode_cursor("game", 3),
+    }
+    assert page["totalCount"] == 10
+
+    page = connection("game", ITEMS, first=4, after=page["pageInfo"]["endCursor"])
+    assert nodes(page) == [4, 5, 6, 7]
+    page = connection("game", ITEMS, first=4, after=page["pageInfo"]["endCursor"])
+    assert nodes(page) == [8, 9]
+    assert not page["pageInfo"]["hasNextPage"]
+    assert page["pageInfo"]["hasPreviousPage"]
+
+
+def test_last_and_before_page_backward():
+    page = connection("guess", ITEMS, last=3)
+    assert nodes(page) == [7, 8, 9]
+    page = connection("guess", ITEMS, last=3, before=page["pageInfo"]["startCursor"])
+    assert nodes(page) == [4, 5, 6]
+    assert connection("guess", ITEMS, after=encode_cursor("guess", 2), before=encode_cursor("guess", 5))["edges"][0]["node"] == 3
+
+
+def test_empty_and_out_of_range():
+    page = connection("game", [], first=5)
+    assert page["edges"] == []
+    assert page["pageInfo"]["startCursor"] is None
+    assert page["totalCount"] == 0
+    assert nodes(connection("game", ITEMS, first=5, after=encode_cursor("game", 42))) == []
+    assert nodes(connection("game", ITEMS, first=-1)) == []
+    # A cursor of another connection is ignored
+    assert nodes(connection("game", ITEMS, first=2, after=encode_cursor("guess", 5))) == [0, 1]
+
+
+def test_pages_are_capped():
+    items = list(range(MAX_PAGE_SIZE * 3))
+    assert len(connection("game", items)["edges"]) == MAX_PAGE_SIZE
+    assert len(connection("game", items, first=MAX_PAGE_SIZE * 2)["edges"]) == MAX_PAGE_SIZE
+    assert nodes(connection("game", items, last=MAX_PAGE_SIZE * 2)) == items[-MAX_PAGE_SIZE:]
+    assert pagination.MAX_PAGE_SIZE == MAX_PAGE_SIZE
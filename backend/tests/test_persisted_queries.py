@@ -0,0 +1,81 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+import persisted_queries
+from persisted_queries import resolve, HASH_MISMATCH, NOT_ALLOWED, NOT_FOUND
+from query_plans import document_hash
+
+# One of the frontend's documents, formatted differently and with __typename
+ALLOWED = "mutation createDuel($creatorId: ID!) { createDuel(creatorId: $creatorId) __typename }"
+OTHER = '{ getUser(userId: "1") { id } }'
+
+
+def persisted(query, query_hash=None) -> dict:
+    data = {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": query_hash or document_hash(query)}}}
+    if query is not None:
+        data["query"] = query
+    return data
+
+
+@pytest.fixture(autouse=True)
+def registered(monkeypatch):
+    monkeypatch.setattr(persisted_queries, "_registered", {})
+    monkeypatch.setattr(persisted_queries, "PERSISTED_QUERIES_ONLY", False)
+
+
+def test_allow_list_ignores_formatting_and_typename():
+    assert persisted_queries.is_allowed(ALLOWED)
+    assert not persisted_queries.is_allowed(OTHER)
+    assert not persisted_queries.is_allowed("{ not graphql")
+
+
+def test_plain_queries_run():
+    assert resolve({"query": OTHER}) == (OTHER, None, None)
+
+
+def test_unknown_hash_is_not_found_until_registered():
+    query_hash = document_hash(ALLOWED)
+    assert resolve(persisted(None, query_hash)) == (None, None, NOT_FOUND)
+    assert resolve(persisted(ALLOWED)) == (ALLOWED, query_hash, None)
+    assert resolve(persisted(None, query_hash)) == (ALLOWED, query_hash, None)
+
+
+def test_hash_mismatch():
+    assert resolve(persisted(ALLOWED, document_hash(OTHER))) == (None, None, HASH_MISMATCH)
+
+
+def test_documents_off_the_list_run_but_are_not_registered():
+    assert resolve(persisted(OTHER)) == (OTHER, document_hash(OTHER), None)
+    assert resolve(persisted(None, document_hash(OTHER))) == (None, None, NOT_FOUND)
+
+
+def test_persisted_queries_only(monkeypatch):
+    monkeypatch.setattr(persisted_queries, "PERSISTED_QUERIES_ONLY", True)
+    assert resolve({"query": OTHER}) == (None, None, NOT_ALLOWED)
+    assert resolve(persisted(OTHER)) == (None, None, NOT_ALLOWED)
+    assert resolve({"query": ALLOWED}) == (ALLOWED, None, None)
+    assert resolve(persisted(ALLOWED))[2] is None
+
+
+def test_registrations_are_bounded(monkeypatch):
+    monkeypatch.setattr(persisted_queries, "MAX_REGISTERED", 0)
+    resolve(persisted(ALLOWED))
+    assert resolve(persisted(None, document_hash(ALLOWED))) == (None, None, NOT_FOUND)
@@ -0,0 +1,68 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+from graphql import build_schema, parse, validate
+
+from pagination import MAX_PAGE_SIZE
+from query_limits import query_limits_rules, QUERY_MAX_COST, QUERY_MAX_DEPTH
+from schema import schema_gql
+
+SCHEMA = build_schema(schema_gql)
+
+
+def errors(query: str, variables: dict = None) -> list:
+    rules = query_limits_rules(variables or {})
+    return [e.message for e in validate(SCHEMA, parse(query), rules)]
+
+
+def nested(depth: int) -> str:
+    """A query going back and forth between a game and its duel, `depth` levels deep."""
+    selection = "id"
+    for i in range(depth - 2):
+        selection = f"{'duel' if i % 2 == 0 else 'currentGame'} {{ {selection} }}"
+    return f"query Deep {{ getGame(gameId: \"1\") {{ {selection} }} }}"
+
+
+def test_frontend_sized_queries_pass():
+    assert errors('{ getUser(userId: "1") { id name duels { id players { id name } } } }') == []
+    assert errors('{ getDuel(duelId: "1") { id currentScore gamesConnection(first: 5) { edges { node { id guesses } } } } }') == []
+
+
+def test_depth_limit():
+    assert errors(nested(QUERY_MAX_DEPTH)) == []
+    assert errors(nested(QUERY_MAX_DEPTH + 1)) == [
+        f"Operation 'Deep' is {QUERY_MAX_DEPTH + 1} levels deep, the limit is {QUERY_MAX_DEPTH}."]
+
+
+def test_cost_limit():
+    query = '{ getUser(userId: "1") { duels { players { duels { players { id } } } } } }'
+    [error] = errors(query)
+    assert error.startswith("Operation 'anonymous' has a cost of ")
+    assert error.endswith(f"the limit is {QUERY_MAX_COST}.")
+
+
+def test_first_counts_including_variables():
+    query = 'query Page($first: Int) { getDuel(duelId: "1") { gamesConnection(first: $first) { edges { node { traceID duel { currentScore } } } } } }'
+    assert errors(query, {"first": 1}) == []
+    # Capped at the page size, which is what the resolver returns at most
+    assert errors(query, {"first": 10**9}) == errors(query, {"first": MAX_PAGE_SIZE})
+
+
+def test_introspection_is_free():
+    assert errors("{ __schema { types { name fields { name type { name ofType { name } } } } } }") == []
@@ -0,0 +1,100 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+scoring.py has to score guesses exactly as the make_guess closure it replaced in
+submit_guess did, copied here as the reference.
+"""
+import itertools
+import random
+
+import numpy as np
+
+from scoring import encode, guess_result, pattern, patterns, score
+
+
+def make_guess(guess, to_be_guessed):
+    discard_letters = set()
+
+    def replace_at(s, i, c):
+        return s[:i] + c + s[i + 1:]
+
+    def dispatch_letter(arg):
+        i, c = arg
+        nonlocal to_be_guessed
+        if c == to_be_guessed[i]:
+            to_be_guessed = replace_at(to_be_guessed, i, c.lower())
+            return c
+        elif c in to_be_guessed:
+            to_be_guessed = replace_at(to_be_guessed, to_be_guessed.rindex(c), c.lower())
+            return f"[{c}]"
+        else:
+            if c.lower() not in to_be_guessed:
+                discard_letters.add(c)
+            return "_"
+
+    return [dispatch_letter(arg) for arg in enumerate(guess)], list(discard_letters)
+
+
+# Few letters so that repeated letters, the tricky cases, come up often
+ALPHABET = "ABCDE"
+
+
+def check_matches(guess, solution):
+    expected_result, expected_discarded = make_guess(guess, solution)
+    result, discarded = score(guess, solution)
+    assert result == expected_result, (guess, solution)
+    assert sorted(discarded) == sorted(expected_discarded), (guess, solution)
+    assert len(discarded) == len(set(discarded))
+
+
+def test_score_matches_make_guess_on_all_short_words():
+    words = ["".join(w) for w in itertools.product(ALPHABET, repeat=3)]
+    for guess, solution in itertools.product(words, repeat=2):
+        check_matches(guess, solution)
+
+
+def test_score_matches_make_guess_on_five_letter_words():
+    rng = random.Random(0)
+    for _ in range(20000):
+        guess = "".join(rng.choices(ALPHABET, k=5))
+        solution = "".join(rng.choices(ALPHABET, k=5))
+        check_matches(guess, solution)
+
+
+def test_score_examples():
+    assert score("SPEED", "ABIDE") == (["_", "_", "[E]", "_", "[D]"], ["S", "P"])
+    assert score("ERASE", "SPEED") == (["[E]", "_", "_", "[S]", "[E]"], ["R", "A"])
+    assert score("HELLO", "HELLO") == (list("HELLO"), [])
+
+
+def test_patterns_match_pattern():
+    rng = random.Random(1)
+    words = ["".join(rng.choices(ALPHABET, k=5)) for _ in range(200)]
+    guess = words[0]
+    codes = patterns(encode([guess]), encode(words))
+    assert codes.tolist() == [pattern(guess, w) for w in words]
+    pairwise = patterns(encode(words), encode(words[::-1]))
+    assert pairwise.tolist() == [pattern(a, b) for a, b in zip(words, words[::-1])]
+    assert isinstance(codes, np.ndarray)
+
+
+def test_guess_result_decodes_pattern():
+    for guess, solution in [("SPEED", "ABIDE"), ("EEEEE", "ABIDE"), ("ABIDE", "ABIDE")]:
+        assert guess_result(pattern(guess, solution), guess) == make_guess(guess, solution)[0]
@@ -0,0 +1,110 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import random
+
+import numpy as np
+import pytest
+
+import pattern_table
+import scoring
+import solver
+
+
+class Lexicon:
+    """The parts of lexicon.Lexicon the solver uses, without the graph."""
+    def __init__(self, words, digest: str):
+        self.length = len(words[0])
+        self._ordered = list(words)
+        self.index = {w: i for i, w in enumerate(words)}
+        self.digest = digest
+
+    def __len__(self):
+        return len(self._ordered)
+
+    def word_at(self, i: int) -> str:
+        return self._ordered[i]
+
+    def ordered(self) -> list:
+        return list(self._ordered)
+
+
+rng = random.Random(0)
+WORDS = sorted({"".join(rng.choices("ABCDEFGH", k=5)) for _ in range(400)})
+SOLUTION = WORDS[17]
+GUESSES = [WORDS[3], WORDS[250], WORDS[101], WORDS[42]]
+
+
+def brute_force(guesses: list) -> np.ndarray:
+    return np.array([all(scoring.pattern(g, w) == scoring.pattern(g, SOLUTION) for g in guesses) for w in WORDS])
+
+
+@pytest.fixture(params=["untabled", "tabled"])
+def lexicon(request, tmp_path, monkeypatch):
+    lexicon = Lexicon(WORDS, f"test-{request.param}")
+    monkeypatch.setattr(pattern_table, "TABLE_DIR", str(tmp_path))
+    if request.param == "tabled":
+        pattern_table.build(lexicon)
+    pattern_table._tables.pop((lexicon.length, lexicon.digest), None)
+    solver.forget("game")
+    return lexicon
+
+
+def test_candidates_agree_with_every_guess(lexicon):
+    mask = solver.candidates("game", lexicon, SOLUTION, GUESSES)
+    assert mask.tolist() == brute_force(GUESSES).tolist()
+    assert mask[lexicon.index[SOLUTION]]
+
+
+def test_candidates_only_apply_the_new_guesses(lexicon, monkeypatch):
+    rows = []
+    row = solver._row
+    monkeypatch.setattr(solver, "_row", lambda lexicon, guess: rows.append(guess) or row(lexicon, guess))
+
+    for n in range(len(GUESSES) + 1):
+        mask = solver.candidates("game", lexicon, SOLUTION, GUESSES[:n])
+        assert mask.tolist() == brute_force(GUESSES[:n]).tolist()
+    assert rows == GUESSES
+
+    # Asked again with the same guesses, nothing is scored
+    solver.candidates("game", lexicon, SOLUTION, GUESSES)
+    assert rows == GUESSES
+
+
+def test_candidates_start_over_with_fewer_guesses(lexicon):
+    solver.candidates("game", lexicon, SOLUTION, GUESSES)
+    mask = solver.candidates("game", lexicon, SOLUTION, GUESSES[:1])
+    assert mask.tolist() == brute_force(GUESSES[:1]).tolist()
+
+
+def test_forget(lexicon):
+    solver.candidates("game", lexicon, SOLUTION, GUESSES)
+    solver.forget("game")
+    assert "game" not in solver._games
+
+
+def test_hints(lexicon):
+    response = solver.hints("game", lexicon, SOLUTION, GUESSES[:1], k=3)
+    remaining = brute_force(GUESSES[:1])
+    assert response["remaining"] == remaining.sum()
+    assert 0 < len(response["hints"]) <= 3
+    bits = [hint["bits"] for hint in response["hints"]]
+    assert bits == sorted(bits, reverse=True)
+    for hint in response["hints"]:
+        assert hint["possibleSolution"] == remaining[lexicon.index[hint["word"]]]
@@ -0,0 +1,69 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Version stamps of users, duels and games.
+
+Each of them carries an RT.Version counter that the mutations bump in the same
+transaction as the change itself. Clients can send back the version they already
+have to the get*IfChanged queries and get a "not modified" answer without anything
+else of the entity being resolved. Entities that were never changed have version 0.
+
+A user's User.duels changes with every change of one of their duels (its players,
+games and last activity), so the mutations of a duel bump its participants too.
+The current version is read when the bump is made, so callers hold the user_locks
+(see locks.py) of the users they bump until their transaction is committed.
+"""
+from zef import *
+from zef.ops import *
+
+
+def version_of(z) -> str:
+    return str(z >> O[RT.Version] | value_or[0] | collect)
+
+
+def bump_changes(*zs) -> list:
+    """
+    The changes that bump the version of each of the given entities, to add to the
+    transaction that changes them.
+    """
+    changes = []
+    for z in zs:
+        version = now(z) >> O[RT.Version] | collect
+        if version is None:
+            changes.append((z, RT.Version, 1))
+        else:
+            changes.append(version <= value(version) + 1)
+    return changes
+
+
+def participants(duel) -> dict:
+    """The participants of the duel by id, whose User.duels changes with the duel."""
+    return {str(origin_uid(u)): u for u in now(duel) >> L[RT.Participant] | collect}
+
+
+def if_changed(z, version: str, field: str) -> dict:
+    """
+    The return value of the get*IfChanged queries: the entity under `field` if its
+    version differs from the one the client has, nothing but the version otherwise.
+    """
+    current = version_of(z)
+    if version is not None and version == current:
+        return {"modified": False, "version": current, field: None}
+    return {"modified": True, "version": current, field: z}
@@ -0,0 +1,198 @@
+# Copyright (c) 2022 Synchronous Technologies Pte Ltd
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of
+# this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Serving the GraphQL API from several processes.
+
+With WORKERS=N (0, the default, keeps everything in the one process run_api.py
+starts), run_api.py runs as the primary: it owns make_primary(g, True), serves the
+GraphQL API on 127.0.0.1:PRIMARY_PORT and the events on EVENTS_PORT, and starts N
+replica workers. The replicas all listen on port 5010 (SO_REUSEPORT, the kernel
+spreads the connections over them), resolve queries on their own synced view of the
+tagged graph and forward mutations as they are to the primary.
+
+Each process serves its own metrics (metrics.py) on a port of its own, METRICS_PORT
+for the primary and METRICS_PORT + 1 + i for replica i, as port 5010 would give a
+scrape to whichever replica the kernel picks.
+
+What a replica keeps in memory besides the graph (the activity index of
+activity.py) is kept up to date from the primary's events: every change of a duel
+is applied once the replica's view has caught up with the duel's version in the
+event.
+"""
+import json
+import os
+import queue
+import socket
+import subprocess
+import sys
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from time import sleep, monotonic
+from urllib.request import Request, urlopen
+
+from zef import *
+from zef.ops import *
+
+WORKERS = int(os.getenv("WORKERS", "0"))
+ROLE = os.getenv("WORKER_ROLE", "primary")
+PRIMARY_PORT = int(os.getenv("PRIMARY_PORT", "5020"))
+METRICS_PORT = int(os.getenv("METRICS_PORT", "5030"))
+# Index of a replica among the replicas of the primary
+INDEX = int(os.getenv("WORKER_INDEX", "0"))
+# How long a replica waits for its view of the graph to catch up with a change
+SYNC_TIMEOUT_SECONDS = 5
+
+
+def spawn_replicas(n: int) -> list:
+    """Starts n replica workers running this same run_api.py."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "run_api.py")
+    return [subprocess.Popen([sys.executable, script], env={**os.environ, "WORKER_ROLE": "replica", "WORKER_INDEX": str(i)})
+            for i in range(n)]
+
+
+def is_mutation(document, name: str = None) -> bool:
+    """Whether the operation the request runs is a mutation. Unparsable queries (no document) are left to the replica to report."""
+    if document is None:
+        return False
+    operations = [d for d in document.definitions if hasattr(d, "operation")]
+    if name:
+        operations = [o for o in operations if o.name is not None and o.name.value == name]
+    return any(o.operation.value == "mutation" for o in operations)
+
+
+def forward_to_primary(body: bytes) -> bytes:
+    request = Request(f"http://127.0.0.1:{PRIMARY_PORT}/gql", data=body, headers={"Content-Type": "application/json"})
+    with urlopen(request) as response:
+        return response.read()
+
+
+class ReusePortHTTPServer(ThreadingHTTPServer):
+    """A thread per request, so forwarded mutations don't hold up the queries of the replica."""
+    daemon_threads = True
+
+    def server_bind(self):
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+def make_handler(schema, path: str = "/gql"):
+    from gql_server import execute, plan_for
+    import persisted_queries
+
+    class GQLHandler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body: bytes = b"", headers: dict = {}):
+            self.send_response(status)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_OPTIONS(self):
+            self._send(200, headers={
+                "Access-Control-Allow-Methods": "*",
+                "Access-Control-Allow-Headers": "*",
+                "Access-Control-Max-Age": "86400",
+            })
+
+        def do_GET(self):
+            if self.path == path:
+                self._send(405, json.dumps({"errors": [{"message": "GraphQL requests are sent with POST."}]}).encode(), {"Allow": "POST, OPTIONS"})
+                return
+            # The metrics of a replica are on its own port, see metrics.serve
+            self._send(404)
+
+        def do_POST(self):
+            if self.path != path:
+                self._send(404)
+                return
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            try:
+                data = json.loads(body)
+            except ValueError:
+                self._send(400, json.dumps({"errors": [{"message": "The request body isn't valid JSON."}]}).encode())
+                return
+            query, query_hash, error = persisted_queries.resolve(data) if isinstance(data, dict) else (None, None, None)
+            # The plan is cached, so telling mutations apart doesn't parse the query again
+            if error is None and isinstance(query, str) and is_mutation(plan_for(schema, query, query_hash).document, data.get("operationName")):
+                # The primary gets the query itself, it may never have seen the hash
+                try:
+                    result = forward_to_primary(json.dumps({**data, "query": query}).encode())
+                except OSError as e:
+                    # HTTPError and URLError: the primary is down or failed, the client still gets an answer
+                    result = json.dumps({"data": None, "errors": [{"message": f"The mutation couldn't be forwarded to the primary: {e}"}]}).encode()
+            else:
+                result = json.dumps(execute(schema, data)).encode()
+            self._send(200, result, {"Content-Type": "application/json"})
+
+        def log_message(self, *args, **kwds):
+            pass
+
+    return GQLHandler
+
+
+def apply_changes(g, changes: queue.SimpleQueue):
+    """Applies the changes of the primary to what this replica keeps in memory, in order."""
+    import activity
+    from versions import version_of
+    while True:
+        event = changes.get()
+        duel_id, version = event["duelId"], event.get("version")
+        deadline = monotonic() + SYNC_TIMEOUT_SECONDS
+        # Waits for the graph to sync the change before reading it
+        while monotonic() < deadline:
+            if duel_id in g and (version is None or int(version_of(now(g)[duel_id])) >= int(version)):
+                break
+            sleep(0.01)
+        if duel_id in g:
+            activity.touch(now(g)[duel_id])
+
+
+def follow_primary(g):
+    """Reads the primary's events for every duel, reconnecting when it goes away."""
+    from events import EVENTS_PORT, ALL_DUELS
+    changes = queue.SimpleQueue()
+    threading.Thread(target=apply_changes, args=(g, changes), daemon=True).start()
+
+    def follow():
+        while True:
+            try:
+                with urlopen(f"http://127.0.0.1:{EVENTS_PORT}/events?duelId={ALL_DUELS}") as stream:
+                    for line in stream:
+                        if line.startswith(b"data: "):
+                            changes.put(json.loads(line[len(b"data: "):]))
+            except OSError:
+                pass
+            sleep(1)
+
+    threading.Thread(target=follow, daemon=True).start()
+
+
+def run_replica(g, port: int = 5010, bind_address: str = "0.0.0.0"):
+    """Serves the GraphQL API of this replica on the shared port, forever."""
+    from zef.gql.generate_gql_api import make_api
+    import metrics
+    schema = make_api(gql_schema(g))
+    follow_primary(g)
+    metrics.serve(METRICS_PORT + 1 + INDEX)
+    server = ReusePortHTTPServer((bind_address, port), make_handler(schema))
+    print(f"Replica {os.getpid()} serving GQL at http://localhost:{port}/gql")
+    server.serve_forever()
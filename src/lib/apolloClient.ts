@@ -19,10 +19,32 @@
  * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
  */
 
-import { ApolloClient, InMemoryCache } from "@apollo/client";
+import { ApolloClient, HttpLink, InMemoryCache } from "@apollo/client";
+import { createPersistedQueryLink } from "@apollo/client/link/persisted-queries";
+
+// Hex sha256 of a query, the id under which the server persists it
+const sha256 = async (query: string): Promise<string> => {
+  const digest = await crypto.subtle.digest(
+    "SHA-256",
+    new TextEncoder().encode(query)
+  );
+  return Array.from(new Uint8Array(digest))
+    .map((byte) => byte.toString(16).padStart(2, "0"))
+    .join("");
+};
+
+const httpLink = new HttpLink({ uri: process.env.REACT_APP_GRAPHQL_ENDPOINT });
+
+// Queries are sent by hash, and only in full the first time the server sees them.
+// crypto.subtle only exists in secure contexts (https or localhost), elsewhere the
+// queries are always sent in full.
+const link =
+  typeof crypto !== "undefined" && crypto.subtle
+    ? createPersistedQueryLink({ sha256 }).concat(httpLink)
+    : httpLink;
 
 const client = new ApolloClient({
-  uri: process.env.REACT_APP_GRAPHQL_ENDPOINT,
+  link,
   cache: new InMemoryCache(),
 });
 
@@ -0,0 +1,59 @@
+/**
+ * Copyright (c) 2022 Synchronous Technologies Pte Ltd
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy of
+ * this software and associated documentation files (the "Software"), to deal in
+ * the Software without restriction, including without limitation the rights to
+ * use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+ * the Software, and to permit persons to whom the Software is furnished to do so,
+ * subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all
+ * copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+ * FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+ * COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+ * IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+import { useEffect, useRef } from "react";
+
+export interface DuelEvent {
+  duelId: string;
+  type: "create" | "game" | "guess" | "accept";
+}
+
+/**
+ * Subscribes to the server-sent events of a duel. onEvent is called for every
+ * change to the duel, onOpen and onError when the connection opens or drops
+ * (the browser reconnects on its own).
+ */
+export const useDuelEvents = (
+  duelId: string | undefined,
+  onEvent: (event: DuelEvent) => void,
+  onOpen?: () => void,
+  onError?: () => void
+) => {
+  const handlers = useRef({ onEvent, onOpen, onError });
+  handlers.current = { onEvent, onOpen, onError };
+
+  useEffect(() => {
+    if (!duelId || !process.env.REACT_APP_EVENTS_ENDPOINT) {
+      handlers.current.onError?.();
+      return;
+    }
+    const source = new EventSource(
+      `${process.env.REACT_APP_EVENTS_ENDPOINT}?duelId=${encodeURIComponent(
+        duelId
+      )}`
+    );
+    source.onopen = () => handlers.current.onOpen?.();
+    source.onerror = () => handlers.current.onError?.();
+    source.onmessage = (message) =>
+      handlers.current.onEvent(JSON.parse(message.data));
+    return () => source.close();
+  }, [duelId]);
+};
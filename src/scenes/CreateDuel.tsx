@@ -19,7 +19,7 @@
  * CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
  */
 
-import React from "react";
+import React, { useState } from "react";
 import { gql, useMutation, useQuery } from "@apollo/client";
 import { useNavigate, Link } from "react-router-dom";
 import toast from "react-hot-toast";
@@ -46,11 +46,14 @@ const CREATE_GAME = gql`
   }
 `;
 
+const RECENT_DUELS_DAYS = 7;
+const RECENT_DUELS_COUNT = 20;
+
 const GET_USER = gql`
-  query getUser($userId: ID!) {
+  query getUser($userId: ID!, $since: Datetime, $first: Int) {
     getUser(userId: $userId) {
       id
-      duels {
+      duels(since: $since, first: $first) {
         id
         players {
           id
@@ -87,8 +90,12 @@ const CreateDuel: React.FC<CreateDuelProps> = (props) => {
     toast.error(createGameError.message);
   }
 
+  // Fixed for the lifetime of the page so the query variables stay the same
+  const [since] = useState(() =>
+    new Date(Date.now() - RECENT_DUELS_DAYS * 24 * 60 * 60 * 1000).toISOString()
+  );
   const { data: user, loading: userLoading } = useQuery(GET_USER, {
-    variables: { userId: getUser().id },
+    variables: { userId: getUser().id, since, first: RECENT_DUELS_COUNT },
   });
 
   const onDuelCreate = async (values: any) => {
@@ -30,12 +30,16 @@ import GraphemeSplitter from "grapheme-splitter";
 import { MAX_WORD_LENGTH, MAX_CHALLENGES } from "constants/settings";
 import { unicodeLength } from "lib/words";
 import { getUser, decodeTraceId } from "lib/storage";
+import { useDuelEvents } from "lib/duelEvents";
 import Grid from "components/grid/Grid";
 import { Keyboard } from "components/keyboard/Keyboard";
 import CreateDuelForm from "forms/CreateDuel";
 import Footer from "components/Footer";
 import Loading from "components/Loading";
 
+// Number of past games shown in the history table
+const HISTORY_SIZE = 20;
+
 const ACCEPT_DUEL = gql`
   mutation acceptDuel($duelId: ID, $playerId: ID) {
     acceptDuel(duelId: $duelId, playerId: $playerId)
@@ -80,25 +84,23 @@ const SUBMIT_GUESS = gql`
 `;
 
 const GET_DUEL = gql`
-  query getDuel($duelId: ID) {
+  query getDuel($duelId: ID, $historySize: Int) {
     getDuel(duelId: $duelId) {
       id
       players {
         id
       }
-      games {
-        id
-        completed
-        solution
-        traceID
-        guesses
-        creator {
-          id
-          name
-        }
-        player {
-          id
-          name
+      gamesConnection(last: $historySize) {
+        edges {
+          node {
+            id
+            completed
+            traceID
+            player {
+              id
+              name
+            }
+          }
         }
       }
       currentGame {
@@ -148,12 +150,29 @@ const Duel: React.FC<DuelProps> = () => {
     fetchPolicy: "network-only",
   });
 
-  const { data: duel, loading: getDuelLoading } = useQuery(GET_DUEL, {
-    variables: { duelId: params.duelId },
+  const {
+    data: duel,
+    loading: getDuelLoading,
+    refetch: refetchDuel,
+    startPolling,
+    stopPolling,
+  } = useQuery(GET_DUEL, {
+    variables: { duelId: params.duelId, historySize: HISTORY_SIZE },
     fetchPolicy: "network-only",
-    pollInterval: 2500,
   });
 
+  // The server pushes every change to this duel, we only poll while that
+  // connection is down.
+  useDuelEvents(
+    params.duelId,
+    () => refetchDuel(),
+    () => {
+      stopPolling();
+      refetchDuel();
+    },
+    () => startPolling(2500)
+  );
+
   const [solution, setSolution] = useState("");
   const [currentGuess, setCurrentGuess] = useState("");
   const [guesses, setGuesses] = useState<string[]>([]);
@@ -427,7 +446,7 @@ const Duel: React.FC<DuelProps> = () => {
                 </tr>
               </thead>
               <tbody>
-                {getDuel().games.map((game: any) => {
+                {getDuel().gamesConnection.edges.map(({ node: game }: any) => {
                   if (game.completed === false) {
                     return null;
                   }